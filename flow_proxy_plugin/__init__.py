@@ -4,14 +4,29 @@ This plugin provides Flow LLM Proxy authentication and request forwarding
 with round-robin load balancing across multiple authentication configurations.
 """
 
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .error_handler import ErrorCode, ErrorHandler
-from .network_error_handler import NetworkErrorHandler
-from .plugins.proxy_plugin import FlowProxyPlugin
-from .plugins.web_server_plugin import FlowProxyWebServerPlugin
+if TYPE_CHECKING:
+    from .error_handler import ErrorCode, ErrorHandler
+    from .network_error_handler import NetworkErrorHandler
+    from .plugins.proxy_plugin import FlowProxyPlugin
+    from .plugins.web_server_plugin import FlowProxyWebServerPlugin
+
+# Public names are resolved on first access (PEP 562) so that importing a
+# submodule such as flow_proxy_plugin.cli does not load every plugin eagerly.
+_LAZY_IMPORTS = {
+    "FlowProxyPlugin": ".plugins.proxy_plugin",
+    "FlowProxyWebServerPlugin": ".plugins.web_server_plugin",
+    "ErrorHandler": ".error_handler",
+    "ErrorCode": ".error_handler",
+    "NetworkErrorHandler": ".network_error_handler",
+}
 
 __all__ = [
     "FlowProxyPlugin",
@@ -20,3 +35,5 @@ __all__ = [
     "ErrorCode",
     "NetworkErrorHandler",
 ]
+
+__getattr__ = lazy_exports(globals(), _LAZY_IMPORTS)
@@ -0,0 +1,30 @@
+"""Lazy package re-exports (PEP 562)."""
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    namespace: dict[str, Any], imports: dict[str, str]
+) -> Callable[[str], Any]:
+    """Build a module-level ``__getattr__`` that imports public names on first access.
+
+    Args:
+        namespace: The package's ``globals()``; resolved names are cached there
+        imports: Mapping of public name to the relative module that defines it
+
+    Returns:
+        Function to assign to the package's ``__getattr__``
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module_name = imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
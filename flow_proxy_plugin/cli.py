@@ -2,10 +2,11 @@
 
 import argparse
 import logging
-import multiprocessing
 import os
+import signal
 import sys
 from pathlib import Path
+from types import FrameType
 
 from proxy.proxy import Proxy, sleep_loop
 
@@ -18,6 +19,56 @@ try:
 except Exception:
     __version__ = "unknown"
 
+_BANNER = "=" * 60
+
+_LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+# (env var, argparse dest, type, default) for options that can be set from the environment
+_ENV_DEFAULTS: tuple[tuple[str, str, type, str], ...] = (
+    ("FLOW_PROXY_PORT", "port", int, "8899"),
+    ("FLOW_PROXY_HOST", "host", str, "127.0.0.1"),
+    ("FLOW_PROXY_LOG_LEVEL", "log_level", str, "INFO"),
+    ("FLOW_PROXY_SECRETS_FILE", "secrets_file", str, "secrets.json"),
+    ("FLOW_PROXY_LOG_DIR", "log_dir", str, "logs"),
+    ("FLOW_PROXY_CLIENT_TIMEOUT", "client_timeout", float, "600"),
+)
+
+_CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+# Default worker count, computed on first use
+_DEFAULT_WORKERS: int | None = None
+
+
+def _cgroup_cpu_limit(cpu_max: Path = _CGROUP_CPU_MAX) -> int | None:
+    """Return the cgroup v2 CPU quota in whole CPUs, or None if unlimited/unknown."""
+    try:
+        quota, period = cpu_max.read_text().split()[:2]
+    except (OSError, ValueError):
+        return None
+    if quota == "max":
+        return None
+    try:
+        return max(1, int(quota) // int(period))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _default_num_workers() -> int:
+    """Return the number of CPUs usable by this process.
+
+    Honours CPU affinity and cgroup v2 quotas so containers don't spawn one
+    worker per host CPU.
+    """
+    global _DEFAULT_WORKERS
+    if _DEFAULT_WORKERS is None:
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cpus = os.cpu_count() or 1
+        limit = _cgroup_cpu_limit()
+        _DEFAULT_WORKERS = min(cpus, limit) if limit else cpus
+    return _DEFAULT_WORKERS
+
 
 def _resolve_runtime_config(
     args: argparse.Namespace, logger: logging.Logger
@@ -26,7 +77,7 @@ def _resolve_runtime_config(
     num_workers = args.num_workers
     if num_workers is None:
         num_workers = (
-            int(os.getenv("FLOW_PROXY_NUM_WORKERS", "0")) or multiprocessing.cpu_count()
+            int(os.getenv("FLOW_PROXY_NUM_WORKERS", "0")) or _default_num_workers()
         )
     threaded = not args.no_threaded and os.getenv("FLOW_PROXY_THREADED", "1") == "1"
     client_timeout = max(1, min(86400, int(args.client_timeout)))
@@ -64,6 +115,15 @@ def _build_proxy_args(
     return proxy_args
 
 
+def _raise_keyboard_interrupt(signum: int, frame: FrameType | None) -> None:
+    """Turn SIGTERM into the same clean shutdown as Ctrl+C.
+
+    Workers shut down through proxy.py's normal path and flush their file logs,
+    and the main process flushes its log queue at exit.
+    """
+    raise KeyboardInterrupt
+
+
 def main() -> None:
     """Main entry point for the CLI."""
     parser = argparse.ArgumentParser(description="Flow Proxy Plugin for proxy.py")
@@ -71,36 +131,31 @@ def main() -> None:
     parser.add_argument(
         "--port",
         type=int,
-        default=int(os.getenv("FLOW_PROXY_PORT", "8899")),
         help="Port to listen on (default: 8899, env: FLOW_PROXY_PORT)",
     )
 
     parser.add_argument(
         "--host",
         type=str,
-        default=os.getenv("FLOW_PROXY_HOST", "127.0.0.1"),
         help="Host to bind to (default: 127.0.0.1, env: FLOW_PROXY_HOST)",
     )
 
     parser.add_argument(
         "--log-level",
         type=str,
-        default=os.getenv("FLOW_PROXY_LOG_LEVEL", "INFO"),
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        choices=_LOG_LEVEL_CHOICES,
         help="Logging level (default: INFO, env: FLOW_PROXY_LOG_LEVEL)",
     )
 
     parser.add_argument(
         "--secrets-file",
         type=str,
-        default=os.getenv("FLOW_PROXY_SECRETS_FILE", "secrets.json"),
         help="Path to secrets.json file (default: secrets.json, env: FLOW_PROXY_SECRETS_FILE)",
     )
 
     parser.add_argument(
         "--log-dir",
         type=str,
-        default=os.getenv("FLOW_PROXY_LOG_DIR", "logs"),
         help="Log directory path (default: logs, env: FLOW_PROXY_LOG_DIR)",
     )
 
@@ -108,7 +163,7 @@ def main() -> None:
         "--num-workers",
         type=int,
         default=None,
-        help="Number of worker processes (default: CPU count, env: FLOW_PROXY_NUM_WORKERS)",
+        help="Number of worker processes (default: available CPUs, env: FLOW_PROXY_NUM_WORKERS)",
     )
 
     parser.add_argument(
@@ -120,11 +175,18 @@ def main() -> None:
     parser.add_argument(
         "--client-timeout",
         type=float,
-        default=float(os.getenv("FLOW_PROXY_CLIENT_TIMEOUT", "600")),
         help="Client connection inactivity timeout in seconds (default: 600, env: FLOW_PROXY_CLIENT_TIMEOUT). "
         "Must be >= backend TTFB for streaming; proxy.py default is 10s which can close before first byte.",
     )
 
+    environ = os.environ
+    parser.set_defaults(
+        **{
+            dest: convert(environ.get(env, default))
+            for env, dest, convert, default in _ENV_DEFAULTS
+        }
+    )
+
     args = parser.parse_args()
 
     # Setup logging
@@ -134,24 +196,24 @@ def main() -> None:
     # Check if secrets file exists
     secrets_path = Path(args.secrets_file)
     if not secrets_path.exists():
-        logger.error(f"Secrets file not found: {args.secrets_file}")
-        logger.error(f"Please create {args.secrets_file} from secrets.json.template")
+        logger.error("Secrets file not found: %s", args.secrets_file)
+        logger.error("Please create %s from secrets.json.template", args.secrets_file)
         sys.exit(1)
 
     num_workers, threaded, client_timeout = _resolve_runtime_config(args, logger)
 
     # Log startup information
-    logger.info("=" * 60)
-    logger.info(f"Flow Proxy Plugin v{__version__}")
-    logger.info("=" * 60)
-    logger.info(f"  Host: {args.host}")
-    logger.info(f"  Port: {args.port}")
-    logger.info(f"  Workers: {num_workers}")
-    logger.info(f"  Threaded: {'enabled' if threaded else 'disabled'}")
-    logger.info(f"  Client timeout: {client_timeout}s")
-    logger.info(f"  Secrets: {args.secrets_file}")
-    logger.info(f"  Log level: {args.log_level}")
-    logger.info("=" * 60)
+    logger.info(_BANNER)
+    logger.info("Flow Proxy Plugin v%s", __version__)
+    logger.info(_BANNER)
+    logger.info("  Host: %s", args.host)
+    logger.info("  Port: %s", args.port)
+    logger.info("  Workers: %s", num_workers)
+    logger.info("  Threaded: %s", "enabled" if threaded else "disabled")
+    logger.info("  Client timeout: %ss", client_timeout)
+    logger.info("  Secrets: %s", args.secrets_file)
+    logger.info("  Log level: %s", args.log_level)
+    logger.info(_BANNER)
 
     # Store secrets file path, log level, and log dir in environment for plugin to access
     os.environ["FLOW_PROXY_SECRETS_FILE"] = args.secrets_file
@@ -160,7 +222,8 @@ def main() -> None:
 
     proxy_args = _build_proxy_args(args, num_workers, threaded, client_timeout)
 
-    # Start proxy with plugin
+    # Start proxy with plugin; workers inherit the SIGTERM handler when forked
+    previous_sigterm = signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
     try:
         logger.info("Starting proxy server...")
         with Proxy(input_args=proxy_args) as proxy:
@@ -168,8 +231,10 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("Shutting down Flow Proxy Plugin")
     except Exception as e:
-        logger.error(f"Error starting proxy: {str(e)}")
+        logger.error("Error starting proxy: %s", str(e))
         sys.exit(1)
+    finally:
+        signal.signal(signal.SIGTERM, previous_sigterm)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,23 @@
 """Core functionality modules."""
 
-from .config import SecretsManager
-from .jwt_generator import JWTGenerator
-from .load_balancer import LoadBalancer
-from .request_forwarder import RequestForwarder
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import SecretsManager
+    from .jwt_generator import JWTGenerator
+    from .load_balancer import LoadBalancer
+    from .request_forwarder import RequestForwarder
+
+# Resolved lazily (PEP 562): RequestForwarder pulls in proxy.py's HTTP parser
+_LAZY_IMPORTS = {
+    "SecretsManager": ".config",
+    "JWTGenerator": ".jwt_generator",
+    "LoadBalancer": ".load_balancer",
+    "RequestForwarder": ".request_forwarder",
+}
 
 __all__ = ["SecretsManager", "JWTGenerator", "LoadBalancer", "RequestForwarder"]
+
+__getattr__ = lazy_exports(globals(), _LAZY_IMPORTS)
@@ -6,23 +6,36 @@ import os
 from pathlib import Path
 from typing import Any
 
-import json5
+# Package root, used as a fallback base for relative secrets paths
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Fields every authentication configuration must define as non-empty strings
+_REQUIRED_FIELDS = ("clientId", "clientSecret", "tenant")
+
+# Validation message templates
+_NOT_A_DICT = "Configuration must be a dictionary, got %s"
+_MISSING_FIELDS = "Missing required fields: %s"
+_FIELD_NOT_STR = "Field '%s' must be a string, got %s"
+_FIELD_EMPTY = "Field '%s' cannot be empty or whitespace-only"
 
 
 class SecretsManager:
     """Manages loading and validation of secrets.json configuration file."""
 
+    # Stateless apart from the shared module logger, so instances carry no __dict__
+    __slots__ = ()
+
+    logger = logging.getLogger(__name__)
+
     def __init__(self) -> None:
         """Initialize SecretsManager."""
-        self.logger = logging.getLogger(__name__)
-        self._validation_errors: list[str] = []
-
         # Set up colored logging if in subprocess
         # Only set up if no handlers exist (to avoid interfering with test fixtures)
         if not self.logger.handlers:
-            log_level_str = os.getenv("FLOW_PROXY_LOG_LEVEL", "INFO")
+            from ..utils.logging import env_log_level, setup_colored_logger
+
+            log_level_str = env_log_level()
             if log_level_str:
-                from ..utils.logging import setup_colored_logger
 
                 # In tests, allow propagation so caplog can capture logs
                 setup_colored_logger(self.logger, log_level_str, propagate=True)
@@ -44,18 +57,25 @@ class SecretsManager:
             # Resolve configuration file path
             resolved_path = self._resolve_config_path(file_path)
 
-            if not resolved_path.exists():
+            self.logger.info("Loading secrets from: %s", resolved_path)
+
+            try:
+                raw = resolved_path.read_bytes()
+            except FileNotFoundError as not_found:
                 error_msg = "Secrets file not found at resolved path: %s (original: %s)"
                 self.logger.error(error_msg, resolved_path, file_path)
-                raise FileNotFoundError(error_msg % (resolved_path, file_path))
-
-            self.logger.info("Loading secrets from: %s", resolved_path)
+                raise FileNotFoundError(error_msg % (resolved_path, file_path)) from not_found
 
             try:
-                with open(resolved_path, encoding="utf-8") as f:
-                    secrets_data = json5.load(f)
+                try:
+                    secrets_data = json.loads(raw)
+                except json.JSONDecodeError:
+                    # Fall back to JSON5 for files using comments or trailing commas
+                    import json5
+
+                    secrets_data = json5.loads(raw.decode("utf-8"))
             except ValueError as json_error:
-                # json5 raises ValueError for parse errors
+                # json and json5 both raise ValueError subclasses for parse errors
                 error_msg = "Invalid JSON format in secrets file %s: %s"
                 self.logger.error(error_msg, resolved_path, str(json_error))
                 raise ValueError(
@@ -106,15 +126,14 @@ class SecretsManager:
         Returns:
             True if all configurations are valid, False otherwise
         """
-        self._validation_errors.clear()
         is_valid = True
 
         for i, config in enumerate(secrets):
-            if not self.validate_single_config(config):
+            errors = self._collect_config_errors(config)
+            if errors:
                 error_msg = "Invalid configuration at index %d: %s"
-                self.logger.error(error_msg, i, ", ".join(self._validation_errors))
+                self.logger.error(error_msg, i, ", ".join(errors))
                 is_valid = False
-                self._validation_errors.clear()  # Clear for next config
 
         return is_valid
 
@@ -127,42 +146,46 @@ class SecretsManager:
         Returns:
             True if configuration is valid, False otherwise
         """
-        required_fields = ["clientId", "clientSecret", "tenant"]
-        self._validation_errors.clear()
+        errors = self._collect_config_errors(config)
 
-        if not isinstance(config, dict):
-            error_msg = "Configuration must be a dictionary, got %s"
-            self._validation_errors.append(error_msg % type(config).__name__)
-            return False
+        # Log detailed validation errors
+        for error in errors:
+            self.logger.error(error)
 
-        # Check for missing required fields
-        missing_fields = [field for field in required_fields if field not in config]
-        if missing_fields:
-            error_msg = "Missing required fields: %s"
-            self._validation_errors.append(error_msg % ", ".join(missing_fields))
-
-        # Check for empty or invalid field values
-        for field in required_fields:
-            if field in config:
-                value = config[field]
-                if not isinstance(value, str):
-                    error_msg = "Field '%s' must be a string, got %s"
-                    self._validation_errors.append(
-                        error_msg % (field, type(value).__name__)
-                    )
-                elif not value.strip():
-                    error_msg = "Field '%s' cannot be empty or whitespace-only"
-                    self._validation_errors.append(error_msg % field)
+        return not errors
 
-        # Log detailed validation errors
-        if self._validation_errors:
-            for error in self._validation_errors:
-                self.logger.error(error)
-            return False
+    @staticmethod
+    def _collect_config_errors(config: dict[str, Any]) -> list[str]:
+        """Collect validation errors for a single authentication configuration.
+
+        Args:
+            config: Single authentication configuration
 
-        return True
+        Returns:
+            List of error messages, empty if configuration is valid
+        """
+        if not isinstance(config, dict):
+            return [_NOT_A_DICT % type(config).__name__]
+
+        # Check presence and value of every required field in a single pass
+        missing_fields: list[str] = []
+        field_errors: list[str] = []
+        for field in _REQUIRED_FIELDS:
+            if field not in config:
+                missing_fields.append(field)
+                continue
+            value = config[field]
+            if not isinstance(value, str):
+                field_errors.append(_FIELD_NOT_STR % (field, type(value).__name__))
+            elif not value.strip():
+                field_errors.append(_FIELD_EMPTY % field)
 
-    def _resolve_config_path(self, file_path: str) -> Path:
+        if missing_fields:
+            field_errors.insert(0, _MISSING_FIELDS % ", ".join(missing_fields))
+        return field_errors
+
+    @staticmethod
+    def _resolve_config_path(file_path: str) -> Path:
         """Resolve configuration file path with support for relative and absolute paths.
 
         Args:
@@ -171,21 +194,18 @@ class SecretsManager:
         Returns:
             Resolved Path object
         """
-        path = Path(file_path)
-
-        # If it's already absolute, return as-is
-        if path.is_absolute():
-            return path
+        # If it's already absolute, return as-is without touching the filesystem
+        if os.path.isabs(file_path):
+            return Path(file_path)
 
         # Try relative to current working directory first
-        if path.exists():
-            return path.resolve()
+        if os.path.exists(file_path):
+            return Path(os.path.realpath(file_path))
 
         # Try relative to the package directory
-        package_dir = Path(__file__).parent.parent
-        package_relative = package_dir / path
-        if package_relative.exists():
-            return package_relative.resolve()
+        package_relative = os.path.join(_PACKAGE_DIR, file_path)
+        if os.path.exists(package_relative):
+            return Path(os.path.realpath(package_relative))
 
         # Return the original path for proper error handling
-        return path.resolve()
+        return Path(os.path.realpath(file_path))
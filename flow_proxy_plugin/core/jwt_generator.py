@@ -1,21 +1,50 @@
 """JWT token generator for Flow LLM Proxy authentication."""
 
+import base64
+import hashlib
+import hmac
+import json
 import logging
 import threading
 import time
+from collections import OrderedDict
 from typing import Any
 
 import jwt
 
 
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as used by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Encoded HS256 header, identical to what jwt.encode emits (sorted, compact).
+# Signing with any other algorithm needs its own precomputed header segment.
+_HS256_HEADER_SEGMENT = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+_REQUIRED_FIELDS = ("clientId", "clientSecret", "tenant")
+
+# Compact JSON encoder matching PyJWT's payload serialisation; json.dumps with
+# non-default arguments would build a new encoder on every call
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+# Shared jwt.decode arguments for validate_token
+_DECODE_ALGORITHMS = ["HS256"]
+_DECODE_OPTIONS = {"verify_exp": False}
+
+
 class JWTGenerator:
     """Generates and caches JWT tokens for Flow LLM Proxy authentication."""
 
-    # Token cache: {client_id: (token, expiry_time)}
-    _cache: dict[str, tuple[str, float]] = {}
+    # Token cache: {(client_id, client_secret, tenant): (token, monotonic_expiry, keyed)},
+    # oldest insertion first. keyed is the HMAC-SHA256 state for the secret, copied
+    # per signature so the key pads are hashed once per entry rather than per token;
+    # it lives and is evicted with the entry.
+    _cache: OrderedDict[tuple[str, str, str], tuple[str, float, hmac.HMAC]] = OrderedDict()
     _lock = threading.Lock()
     _ttl = 3600  # 1 hour
     _margin = 300  # Refresh 5 minutes before expiry
+    _max_size = 4096  # Max cached tokens before expired/oldest entries are evicted
 
     def __init__(self, logger: logging.Logger | None = None) -> None:
         """Initialize JWT generator.
@@ -37,38 +66,125 @@ class JWTGenerator:
         Raises:
             ValueError: If config is invalid
         """
-        # Validate config
-        required = ["clientId", "clientSecret", "tenant"]
-        missing = [f for f in required if not config.get(f, "").strip()]
-        if missing:
-            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        now = time.monotonic()
 
-        client_id = config["clientId"]
-        now = time.time()
+        # Check cache; a single dict read is atomic, so hits don't take the lock.
+        # Only validated configs are ever cached, so a hit needs no validation.
+        lookup_key = (config.get("clientId"), config.get("clientSecret"), config.get("tenant"))
+        cached = self._cache.get(lookup_key)  # type: ignore[arg-type]
+        if cached is not None and now < cached[1] - self._margin:
+            self.logger.debug("Using cached token for %s", config["clientId"])
+            return cached[0]
 
-        # Check cache
+        cache_key = self._cache_key(config)
+        client_id = cache_key[0]
         with self._lock:
-            if client_id in self._cache:
-                token, expiry = self._cache[client_id]
-                if now < expiry - self._margin:
-                    self.logger.debug(f"Using cached token for {client_id}")
-                    return token
-
-        # Generate new token
-        payload = {
-            "clientId": config["clientId"],
-            "clientSecret": config["clientSecret"],
-            "tenant": config["tenant"],
-        }
-        token = jwt.encode(payload, config["clientSecret"], algorithm="HS256")
+            # Re-check under the lock so concurrent misses on the same key sign once
+            cached = self._cache.get(cache_key)
+            if cached is not None and now < cached[1] - self._margin:
+                return cached[0]
+            token = self._store_new_token(cache_key, now)
+
+        self.logger.debug("Generated JWT token for %s", client_id)
+        return token
+
+    def generate_tokens(self, configs: list[dict[str, str]]) -> list[str]:
+        """Generate or return cached JWT tokens for several configs at once.
+
+        All configs are validated before any token is signed, and the cache lock
+        is taken once for the whole batch. Useful for warm-up at startup.
+
+        Args:
+            configs: Auth configs with clientId, clientSecret, and tenant
+
+        Returns:
+            JWT token strings, in the same order as configs
+
+        Raises:
+            ValueError: If any config is invalid
+        """
+        cache_keys = [self._cache_key(config) for config in configs]
+        now = time.monotonic()
+        tokens: list[str] = []
 
-        # Cache it
         with self._lock:
-            self._cache[client_id] = (token, now + self._ttl)
+            for cache_key in cache_keys:
+                cached = self._cache.get(cache_key)
+                if cached is not None and now < cached[1] - self._margin:
+                    tokens.append(cached[0])
+                else:
+                    tokens.append(self._store_new_token(cache_key, now))
 
-        self.logger.debug("Generated JWT token for %s", client_id)
+        self.logger.debug("Prepared %d JWT tokens", len(tokens))
+        return tokens
+
+    @staticmethod
+    def _cache_key(config: dict[str, str]) -> tuple[str, str, str]:
+        """Validate config and return its cache key.
+
+        Args:
+            config: Auth config with clientId, clientSecret, and tenant
+
+        Returns:
+            (clientId, clientSecret, tenant) tuple
+
+        Raises:
+            ValueError: If config is invalid
+        """
+        missing = [f for f in _REQUIRED_FIELDS if not config.get(f, "").strip()]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+
+        # Key on every signed field so a rotated secret or tenant never hits a stale token
+        return (config["clientId"], config["clientSecret"], config["tenant"])
+
+    @classmethod
+    def _store_new_token(cls, cache_key: tuple[str, str, str], now: float) -> str:
+        """Sign a token for cache_key and cache it. Must be called with _lock held.
+
+        Args:
+            cache_key: (clientId, clientSecret, tenant) tuple
+            now: Current monotonic time
+
+        Returns:
+            JWT token string
+        """
+        client_id, client_secret, tenant = cache_key
+        payload = {"clientId": client_id, "clientSecret": client_secret, "tenant": tenant}
+        # Reuse the keyed HMAC from an expired entry for the same key
+        previous = cls._cache.get(cache_key)
+        if previous is not None:
+            keyed = previous[2]
+        else:
+            keyed = hmac.new(client_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        # Signing is a single HMAC, cheap enough to do while holding the lock
+        token = cls._encode_hs256(payload, keyed)
+
+        cls._cache[cache_key] = (token, now + cls._ttl, keyed)
+        cls._cache.move_to_end(cache_key)
+        if len(cls._cache) > cls._max_size:
+            cls._evict(now)
         return token
 
+    @staticmethod
+    def _encode_hs256(payload: dict[str, Any], keyed: hmac.HMAC) -> str:
+        """Encode and sign payload as an HS256 JWT.
+
+        Produces the same token as ``jwt.encode(payload, secret, algorithm="HS256")``.
+
+        Args:
+            payload: JWT payload
+            keyed: HMAC-SHA256 state keyed with the secret; copied, never updated
+
+        Returns:
+            JWT token string
+        """
+        payload_json = _encode_json(payload).encode("utf-8")
+        signing_input = _HS256_HEADER_SEGMENT + b"." + _b64url(payload_json)
+        mac = keyed.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
     def create_jwt_payload(self, config: dict[str, str]) -> dict[str, Any]:
         """Create JWT payload from config.
 
@@ -94,24 +210,42 @@ class JWTGenerator:
         Returns:
             True if valid
         """
+        # Reject str tokens that are not three dot-separated segments before decoding;
+        # other types (e.g. bytes) are left to jwt.decode, as before
+        if type(token) is str and token.count(".") != 2:
+            return False
         try:
             decoded = jwt.decode(
                 token,
                 secret,
-                algorithms=["HS256"],
-                options={"verify_exp": False},
+                algorithms=_DECODE_ALGORITHMS,
+                options=_DECODE_OPTIONS,  # type: ignore[arg-type]
             )
-            required = ["clientId", "clientSecret", "tenant"]
-            return all(f in decoded for f in required)
+            return all(f in decoded for f in _REQUIRED_FIELDS)
         except jwt.InvalidTokenError:
             return False
 
+    @classmethod
+    def _evict(cls, now: float) -> None:
+        """Drop expired tokens, then the oldest ones, until within _max_size.
+
+        Must be called with _lock held.
+
+        Args:
+            now: Current monotonic time
+        """
+        cache = cls._cache
+        for key in [k for k, entry in cache.items() if entry[1] <= now]:
+            del cache[key]
+        while len(cache) > cls._max_size:
+            cache.popitem(last=False)
+
     def clear_cache(self) -> None:
         """Clear token cache."""
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
-            self.logger.info(f"Cleared {count} cached tokens")
+            self.logger.info("Cleared %d cached tokens", count)
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -120,9 +254,9 @@ class JWTGenerator:
             Cache stats dictionary
         """
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             valid = sum(
-                1 for _, exp in self._cache.values() if now < exp - self._margin
+                1 for entry in self._cache.values() if now < entry[1] - self._margin
             )
             return {
                 "total": len(self._cache),
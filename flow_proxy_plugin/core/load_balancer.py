@@ -1,14 +1,14 @@
 """Load balancer for distributing requests across multiple authentication configurations."""
 
+import itertools
 import logging
-import os
 import threading
-from collections.abc import Iterator
-from contextlib import contextmanager
 from dataclasses import dataclass
 
+from ..utils.logging import env_log_level, setup_colored_logger
 
-@dataclass
+
+@dataclass(slots=True)
 class LoadBalancerStats:
     """Statistics for load balancer operations."""
 
@@ -22,7 +22,9 @@ class LoadBalancer:
     """Thread-safe round-robin load balancer for authentication configurations.
 
     This class implements a round-robin load balancing strategy with automatic
-    failover support. All operations are thread-safe through internal locking.
+    failover support. Selection is lock-free: it draws a ticket from an
+    itertools.count and indexes an immutable snapshot of the available configs.
+    Failover and reset take an internal lock and publish a new snapshot.
 
     Example:
         >>> lb = LoadBalancer(configs, logger)
@@ -30,6 +32,18 @@ class LoadBalancer:
         >>> lb.mark_config_failed(config)  # Automatic failover
     """
 
+    __slots__ = (
+        "_logger",
+        "_lock",
+        "_all_configs",
+        "_available_configs",
+        "_config_ids",
+        "_failed_ids",
+        "_config_names",
+        "_tickets",
+        "_served",
+    )
+
     def __init__(
         self, configs: list[dict[str, str]], logger: logging.Logger | None = None
     ) -> None:
@@ -48,14 +62,24 @@ class LoadBalancer:
         self._logger = self._setup_logger(logger)
         self._lock = threading.Lock()
 
-        # Configuration state
-        self._all_configs = configs.copy()
-        self._available_configs = configs.copy()
-        self._failed_configs: list[dict[str, str]] = []
-
-        # Round-robin state
-        self._current_index = 0
-        self._total_requests = 0
+        # Configuration state; configs are tracked by identity so membership
+        # checks are O(1) set lookups rather than dict equality scans
+        self._all_configs: tuple[dict[str, str], ...] = tuple(configs)
+        # Starts as the same tuple as _all_configs; replaced, never mutated
+        self._available_configs = self._all_configs
+        self._config_ids = frozenset(id(c) for c in self._all_configs)
+        self._failed_ids: set[int] = set()
+        # Display names resolved once, keyed by config identity
+        self._config_names = {
+            id(c): self._extract_config_name(c) for c in self._all_configs
+        }
+
+        # Round-robin position; next() on itertools.count is atomic under the GIL
+        # and survives failover, so removing a config does not restart the rotation
+        self._tickets = itertools.count()
+        # Served-request tally; an unlocked += may rarely lose an increment under
+        # contention, which is acceptable for a statistic
+        self._served = 0
 
         self._logger.info(
             "LoadBalancer initialized with %d configurations", len(self._all_configs)
@@ -71,20 +95,12 @@ class LoadBalancer:
 
         # Setup colored logging if needed
         if not logger.handlers:
-            log_level = os.getenv("FLOW_PROXY_LOG_LEVEL", "INFO")
+            log_level = env_log_level()
             if log_level:
-                from ..utils.logging import setup_colored_logger
-
                 setup_colored_logger(logger, log_level, propagate=True)
 
         return logger
 
-    @contextmanager
-    def _thread_safe(self) -> Iterator[None]:
-        """Context manager for thread-safe operations."""
-        with self._lock:
-            yield
-
     def get_next_config(self) -> dict[str, str]:
         """Get next authentication configuration using round-robin strategy.
 
@@ -100,25 +116,24 @@ class LoadBalancer:
             >>> config = lb.get_next_config()
             >>> print(config['name'])
         """
-        with self._thread_safe():
-            if not self._available_configs:
-                raise RuntimeError(
-                    "No available authentication configurations - all configs have failed"
-                )
-
-            # Round-robin selection
-            config = self._available_configs[self._current_index]
-            self._total_requests += 1
-
-            # Log usage
-            self._log_config_usage(config)
+        # The snapshot is replaced atomically, never mutated, so no lock is needed
+        configs = self._available_configs
+        if not configs:
+            raise RuntimeError(
+                "No available authentication configurations - all configs have failed"
+            )
+        config = configs[next(self._tickets) % len(configs)]
+        self._served += 1
 
-            # Advance to next index (circular)
-            self._current_index = (self._current_index + 1) % len(
-                self._available_configs
+        # Log usage
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Using config '%s' (request #%d)",
+                self._config_names[id(config)],
+                self._served,
             )
 
-            return config
+        return config
 
     def mark_config_failed(self, config: dict[str, str]) -> None:
         """Mark configuration as failed and remove from available pool.
@@ -134,28 +149,36 @@ class LoadBalancer:
             ... except AuthError:
             ...     lb.mark_config_failed(config)
         """
-        with self._thread_safe():
-            if config not in self._available_configs:
+        with self._lock:
+            config_id = id(config)
+            if config_id not in self._config_ids:
+                self._logger.warning(
+                    "Ignoring unknown config '%s'", self._extract_config_name(config)
+                )
+                return
+            if config_id in self._failed_ids:
                 self._logger.warning(
                     "Config '%s' already marked as failed",
-                    self._extract_config_name(config),
+                    self._config_names[config_id],
                 )
                 return
 
-            # Move from available to failed
-            self._available_configs.remove(config)
-            self._failed_configs.append(config)
+            # Move from available to failed, keeping round-robin order intact
+            self._failed_ids.add(config_id)
+            self._available_configs = tuple(
+                c for c in self._available_configs if c is not config
+            )
 
             # Log the failure
             self._logger.error(
                 "Config '%s' marked as failed. Available: %d/%d",
-                self._extract_config_name(config),
+                self._config_names[config_id],
                 len(self._available_configs),
                 len(self._all_configs),
             )
 
-            # Adjust index if needed
-            self._adjust_current_index()
+            if not self._available_configs:
+                self._logger.critical("All authentication configurations have failed!")
 
     def reset_failed_configs(self) -> None:
         """Reset all failed configurations back to available pool.
@@ -165,15 +188,16 @@ class LoadBalancer:
         Example:
             >>> lb.reset_failed_configs()  # Restore all configs
         """
-        with self._thread_safe():
-            if not self._failed_configs:
+        with self._lock:
+            if not self._failed_ids:
                 self._logger.debug("No failed configurations to reset")
                 return
 
-            count = len(self._failed_configs)
-            self._available_configs.extend(self._failed_configs)
-            self._failed_configs.clear()
-            self._current_index = 0
+            count = len(self._failed_ids)
+            self._failed_ids.clear()
+            # Restart the rotation from the first config
+            self._available_configs = self._all_configs
+            self._tickets = itertools.count()
 
             self._logger.info(
                 "Reset %d failed configs. Total available: %d",
@@ -181,23 +205,6 @@ class LoadBalancer:
                 len(self._available_configs),
             )
 
-    def _adjust_current_index(self) -> None:
-        """Adjust current index after configuration removal."""
-        if self._available_configs:
-            self._current_index %= len(self._available_configs)
-        else:
-            self._current_index = 0
-            self._logger.critical("All authentication configurations have failed!")
-
-    def _log_config_usage(self, config: dict[str, str]) -> None:
-        """Log configuration usage with context."""
-        self._logger.info(
-            "Using config '%s' (request #%d, index %d)",
-            self._extract_config_name(config),
-            self._total_requests,
-            self._current_index,
-        )
-
     @staticmethod
     def _extract_config_name(config: dict[str, str]) -> str:
         """Extract human-readable name from configuration.
@@ -227,13 +234,15 @@ class LoadBalancer:
             >>> stats = lb.get_stats()
             >>> print(f"Processed {stats.total_requests} requests")
         """
-        with self._thread_safe():
-            return LoadBalancerStats(
-                total_requests=self._total_requests,
-                available_count=len(self._available_configs),
-                failed_count=len(self._failed_configs),
-                total_count=len(self._all_configs),
-            )
+        # One snapshot read gives mutually consistent counts without the lock
+        available = len(self._available_configs)
+        total = len(self._all_configs)
+        return LoadBalancerStats(
+            total_requests=self._served,
+            available_count=available,
+            failed_count=total - available,
+            total_count=total,
+        )
 
     # Properties for backward compatibility
     @property
@@ -244,7 +253,7 @@ class LoadBalancer:
     @property
     def failed_count(self) -> int:
         """Number of currently failed configurations."""
-        return len(self._failed_configs)
+        return len(self._all_configs) - len(self._available_configs)
 
     @property
     def total_count(self) -> int:
@@ -254,14 +263,15 @@ class LoadBalancer:
     @property
     def total_requests(self) -> int:
         """Total number of requests processed."""
-        return self._total_requests
+        return self._served
 
     def __repr__(self) -> str:
         """String representation of LoadBalancer."""
-        stats = self.get_stats()
+        available = len(self._available_configs)
+        total = len(self._all_configs)
         return (
-            f"LoadBalancer(total={stats.total_count}, "
-            f"available={stats.available_count}, "
-            f"failed={stats.failed_count}, "
-            f"requests={stats.total_requests})"
+            f"LoadBalancer(total={total}, "
+            f"available={available}, "
+            f"failed={total - available}, "
+            f"requests={self._served})"
         )
@@ -1,7 +1,6 @@
 """Request forwarder for handling HTTP requests to Flow LLM Proxy."""
 
 import logging
-import os
 
 from proxy.http.parser import HttpParser
 
@@ -9,6 +8,10 @@ from proxy.http.parser import HttpParser
 class RequestForwarder:
     """Handles request forwarding to Flow LLM Proxy."""
 
+    # handle_response_chunk returns chunks unchanged, so callers may skip it;
+    # subclasses that inspect or rewrite response data must set this to False
+    passthrough_response_chunks = True
+
     def __init__(self, logger: logging.Logger | None = None) -> None:
         """Initialize request forwarder.
 
@@ -20,9 +23,10 @@ class RequestForwarder:
         # Set up colored logging if logger was created and in subprocess
         # Only set up if no handlers exist (to avoid interfering with test fixtures)
         if logger is None and not self.logger.handlers:
-            log_level_str = os.getenv("FLOW_PROXY_LOG_LEVEL", "INFO")
+            from ..utils.logging import env_log_level, setup_colored_logger
+
+            log_level_str = env_log_level()
             if log_level_str:
-                from ..utils.logging import setup_colored_logger
 
                 # In tests, allow propagation so caplog can capture logs
                 setup_colored_logger(self.logger, log_level_str, propagate=True)
@@ -34,6 +38,17 @@ class RequestForwarder:
             "RequestForwarder initialized with target: %s", self.target_base_url
         )
 
+    @property
+    def target_base_url(self) -> str:
+        """Base URL that reverse-proxy request paths are appended to."""
+        return self._target_base_url
+
+    @target_base_url.setter
+    def target_base_url(self, value: str) -> None:
+        self._target_base_url = value
+        # Encoded once so per-request URL building is a single bytes concatenation
+        self.target_base_url_bytes = value.encode()
+
     def modify_request_headers(
         self,
         request: HttpParser | None,
@@ -84,12 +99,12 @@ class RequestForwarder:
         # Update Host header to target host
         request.headers[b"Host"] = (self.target_host.encode(), b"")
 
-        config_info = f" (config: {config_name})" if config_name else ""
-        self.logger.info(
-            "Modified request headers with JWT token%s, target host: %s",
-            config_info,
-            self.target_host,
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Modified request headers with JWT token%s, target host: %s",
+                f" (config: {config_name})" if config_name else "",
+                self.target_host,
+            )
 
         return request
 
@@ -6,9 +6,10 @@ and error code mappings for the Flow Proxy Plugin.
 
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
 
 
 class ErrorCode(Enum):
@@ -44,6 +45,108 @@ class ErrorCode(Enum):
     INTERNAL_PROCESSING_FAILED = "INTERNAL_5002"
 
 
+# Stand-in for the timestamp when pre-rendering response templates
+_TIMESTAMP_PLACEHOLDER = "__TIMESTAMP__"
+_RESPONSE_TAIL = b"\r\nConnection: close\r\n\r\n"
+
+# Reused encoder: json.dumps(..., indent=2) builds a new JSONEncoder per call.
+# ensure_ascii (the default) keeps the output ASCII, so len() is the byte count.
+_encode_body = json.JSONEncoder(indent=2).encode
+
+# Error timestamps may lag the wall clock by up to this many seconds
+_TIMESTAMP_REFRESH = 0.05
+# (monotonic refresh deadline, ISO timestamp, ISO timestamp as bytes)
+_cached_timestamp: tuple[float, str, bytes] = (float("-inf"), "", b"")
+
+
+def _utc_timestamp() -> tuple[str, bytes]:
+    """Return the current UTC time in ISO format, reformatted at most every 50 ms.
+
+    Returns:
+        Tuple of (ISO timestamp, the same timestamp encoded as ASCII bytes)
+    """
+    global _cached_timestamp
+    now = time.monotonic()
+    deadline, timestamp, timestamp_bytes = _cached_timestamp
+    if now >= deadline:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp_bytes = timestamp.encode("ascii")
+        # Rebinding one tuple keeps the cached pair consistent across threads
+        _cached_timestamp = (now + _TIMESTAMP_REFRESH, timestamp, timestamp_bytes)
+    return timestamp, timestamp_bytes
+
+
+_STATUS_TEXTS = {
+    400: "Bad Request",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+
+def _error_body(
+    error_code: ErrorCode,
+    timestamp: str,
+    details: str | None,
+    additional_context: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Build the JSON error body.
+
+    Args:
+        error_code: The error code enum
+        timestamp: ISO timestamp (or template placeholder)
+        details: Optional detailed error description
+        additional_context: Optional additional context information
+
+    Returns:
+        Standardized error response dictionary
+    """
+    response: dict[str, Any] = {
+        "error": error_code.value,
+        "message": _MESSAGES[error_code],
+        "timestamp": timestamp,
+    }
+
+    if details:
+        response["details"] = details
+
+    if additional_context:
+        response["context"] = additional_context
+
+    return response
+
+
+def _render_template(error_code: ErrorCode) -> tuple[bytes, bytes, bytes]:
+    """Pre-render a detail-free HTTP error response around a timestamp slot.
+
+    Args:
+        error_code: The error code enum
+
+    Returns:
+        Tuple of (head up to the Content-Length value, body prefix, body suffix)
+    """
+    body_json = _encode_body(
+        _error_body(error_code, _TIMESTAMP_PLACEHOLDER, None, None)
+    )
+    body_prefix, body_suffix = body_json.encode("ascii").split(
+        _TIMESTAMP_PLACEHOLDER.encode("ascii"), 1
+    )
+    return _RESPONSE_HEADS[error_code], body_prefix, body_suffix
+
+
+class _LazyContext:
+    """Renders a context dict as "k=v, ..." only when a log record is formatted."""
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context: dict[str, Any]) -> None:
+        self._context = context
+
+    def __str__(self) -> str:
+        return ", ".join(f"{k}={v}" for k, v in self._context.items())
+
+
 class ErrorHandler:
     """Unified error handler for the plugin.
 
@@ -51,6 +154,8 @@ class ErrorHandler:
     and error code management.
     """
 
+    __slots__ = ("logger",)
+
     # Error code to HTTP status code mapping
     ERROR_STATUS_MAP = {
         # Configuration errors -> 500 Internal Server Error
@@ -107,6 +212,10 @@ class ErrorHandler:
         ErrorCode.INTERNAL_PROCESSING_FAILED: "Request processing failed",
     }
 
+    # Pre-rendered responses for errors without details/context:
+    # {error_code: (status line and headers up to Content-Length, body prefix, body suffix)}
+    _response_templates: ClassVar[dict[ErrorCode, tuple[bytes, bytes, bytes]]] = {}
+
     def __init__(self, logger: logging.Logger | None = None) -> None:
         """Initialize error handler.
 
@@ -131,19 +240,7 @@ class ErrorHandler:
         Returns:
             Standardized error response dictionary
         """
-        response: dict[str, Any] = {
-            "error": error_code.value,
-            "message": self.ERROR_MESSAGE_MAP.get(error_code, "An error occurred"),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-
-        if details:
-            response["details"] = details
-
-        if additional_context:
-            response["context"] = additional_context
-
-        return response
+        return _error_body(error_code, _utc_timestamp()[0], details, additional_context)
 
     def format_error_response_http(
         self,
@@ -161,22 +258,42 @@ class ErrorHandler:
         Returns:
             Complete HTTP response as bytes
         """
-        status_code = self.ERROR_STATUS_MAP.get(error_code, 500)
-        status_text = self._get_status_text(status_code)
+        if not details and not additional_context:
+            head, body_prefix, body_suffix = self._get_response_template(error_code)
+            body = body_prefix + _utc_timestamp()[1] + body_suffix
+            return b"".join(
+                (head, str(len(body)).encode("ascii"), _RESPONSE_TAIL, body)
+            )
 
         error_body = self.create_error_response(error_code, details, additional_context)
-        body_json = json.dumps(error_body, indent=2)
-
-        response = (
-            f"HTTP/1.1 {status_code} {status_text}\r\n"
-            f"Content-Type: application/json\r\n"
-            f"Content-Length: {len(body_json)}\r\n"
-            f"Connection: close\r\n"
-            f"\r\n"
-            f"{body_json}"
+        body = _encode_body(error_body).encode("ascii")
+
+        return b"".join(
+            (
+                _RESPONSE_HEADS[error_code],
+                str(len(body)).encode("ascii"),
+                _RESPONSE_TAIL,
+                body,
+            )
         )
 
-        return response.encode("utf-8")
+    def _get_response_template(
+        self, error_code: ErrorCode
+    ) -> tuple[bytes, bytes, bytes]:
+        """Return the pre-rendered HTTP response pieces for error_code.
+
+        Args:
+            error_code: The error code enum
+
+        Returns:
+            Tuple of (head up to the Content-Length value, body prefix, body suffix)
+            where the timestamp goes between the body prefix and suffix
+        """
+        template = self._response_templates.get(error_code)
+        if template is None:
+            template = _render_template(error_code)
+            self._response_templates[error_code] = template
+        return template
 
     def log_error(
         self,
@@ -193,29 +310,20 @@ class ErrorHandler:
             exception: Optional exception object
             additional_context: Optional additional context information
         """
-        message = self.ERROR_MESSAGE_MAP.get(error_code, "Unknown error")
-        log_message = f"[{error_code.value}] {message}"
-
-        if details:
-            log_message += f" - {details}"
-
-        if additional_context:
-            context_str = ", ".join(f"{k}={v}" for k, v in additional_context.items())
-            log_message += f" | Context: {context_str}"
-
-        # Determine log level based on error type
-        if error_code.value.startswith("CONFIG") or error_code.value.startswith(
-            "INTERNAL"
-        ):
-            self.logger.error(log_message, exc_info=exception)
-        elif error_code.value.startswith("AUTH"):
-            self.logger.error(log_message, exc_info=exception)
-        elif error_code.value.startswith("NETWORK"):
-            self.logger.warning(log_message, exc_info=exception)
-        elif error_code.value.startswith("REQUEST"):
-            self.logger.info(log_message)
-        else:
-            self.logger.error(log_message, exc_info=exception)
+        level, with_exc_info = _LOG_DISPATCH[error_code]
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # Handlers join the pieces once the record is actually emitted
+        self.logger.log(
+            level,
+            "%s%s%s%s",
+            _LOG_PREFIXES[error_code],
+            f" - {details}" if details else "",
+            " | Context: " if additional_context else "",
+            _LazyContext(additional_context) if additional_context else "",
+            exc_info=exception if with_exc_info else None,
+        )
 
     def handle_exception(
         self,
@@ -307,20 +415,37 @@ class ErrorHandler:
             return ErrorCode.AUTH_NO_AVAILABLE_CONFIGS
         return ErrorCode.INTERNAL_UNEXPECTED_ERROR
 
-    def _get_status_text(self, status_code: int) -> str:
-        """Get HTTP status text for status code.
 
-        Args:
-            status_code: HTTP status code
+# Per-code lookups, precomputed once for every ErrorCode
+# Status line and headers up to the Content-Length value
+_RESPONSE_HEADS = {
+    code: f"HTTP/1.1 {status} {_STATUS_TEXTS[status]}\r\n"
+    f"Content-Type: application/json\r\n"
+    f"Content-Length: ".encode("ascii")
+    for code, status in ErrorHandler.ERROR_STATUS_MAP.items()
+}
+_MESSAGES = ErrorHandler.ERROR_MESSAGE_MAP
+_LOG_PREFIXES = {
+    code: f"[{code.value}] {message}"
+    for code, message in ErrorHandler.ERROR_MESSAGE_MAP.items()
+}
 
-        Returns:
-            Status text string
-        """
-        status_texts = {
-            400: "Bad Request",
-            500: "Internal Server Error",
-            502: "Bad Gateway",
-            503: "Service Unavailable",
-            504: "Gateway Timeout",
-        }
-        return status_texts.get(status_code, "Error")
+
+def _log_dispatch(error_code: ErrorCode) -> tuple[int, bool]:
+    """Pick the log level for an error code from its category prefix.
+
+    Args:
+        error_code: The error code enum
+
+    Returns:
+        Tuple of (log level, whether to attach exception info)
+    """
+    if error_code.value.startswith("NETWORK"):
+        return logging.WARNING, True
+    if error_code.value.startswith("REQUEST"):
+        # Client mistakes are expected; log them without tracebacks
+        return logging.INFO, False
+    return logging.ERROR, True
+
+
+_LOG_DISPATCH = {code: _log_dispatch(code) for code in ErrorCode}
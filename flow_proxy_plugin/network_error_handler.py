@@ -4,9 +4,14 @@ This module provides specialized network error handling including
 connection timeouts, retry mechanisms, and upstream availability checks.
 """
 
+import asyncio
+import concurrent.futures
 import logging
+import random
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from enum import Enum
 from typing import Any, TypeVar
 
 from .error_handler import ErrorCode, ErrorHandler
@@ -14,15 +19,237 @@ from .error_handler import ErrorCode, ErrorHandler
 T = TypeVar("T")
 
 
+def _start_timed_operation(operation: Callable[[], T]) -> concurrent.futures.Future[T]:
+    """Run operation on its own daemon thread and return a future for its outcome.
+
+    A daemon thread per call means an operation that hangs past its timeout
+    holds only its own thread: it cannot starve later calls and does not block
+    interpreter exit.
+    """
+    future: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+    def run() -> None:
+        try:
+            result = operation()
+        except BaseException as exc:  # pylint: disable=broad-exception-caught
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name="flow-proxy-timeout", daemon=True).start()
+    return future
+
+
+# Max circuit breakers kept per NetworkErrorHandler (one per distinct target URL)
+_MAX_BREAKERS = 1024
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Requests flow; failures are counted
+    OPEN = "open"  # Requests are rejected until the cooldown passes
+    HALF_OPEN = "half_open"  # A few probe requests test whether upstream recovered
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised when a request is short-circuited by an open circuit breaker."""
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single upstream.
+
+    The circuit opens when, within a rolling window, at least failure_threshold
+    requests were recorded and the failing share reaches failure_ratio. After
+    reset_timeout seconds it lets up to probe_limit requests through; a probe
+    success closes the circuit again and a probe failure re-opens it. Probe slots
+    whose outcome is never recorded are released after probe_timeout seconds.
+
+    The closed-state check in allow_request is a plain attribute read; the lock
+    is only taken to record outcomes and change state.
+    """
+
+    __slots__ = (
+        "failure_threshold",
+        "failure_ratio",
+        "window_seconds",
+        "reset_timeout",
+        "probe_limit",
+        "probe_timeout",
+        "state",
+        "_lock",
+        "_window_start",
+        "_failures",
+        "_total",
+        "_opened_at",
+        "_probes",
+        "_probe_started",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_ratio: float = 0.8,
+        window_seconds: float = 5.0,
+        reset_timeout: float = 10.0,
+        probe_limit: int = 1,
+        probe_timeout: float = 30.0,
+    ) -> None:
+        """Initialize circuit breaker in the closed state.
+
+        Args:
+            failure_threshold: Minimum requests in a window before it can open
+            failure_ratio: Failing share of requests in a window that opens it
+            window_seconds: Length of the rolling failure window in seconds
+            reset_timeout: Seconds to stay open before probing the upstream
+            probe_limit: Requests let through while half-open
+            probe_timeout: Seconds after which probes with no recorded outcome
+                free their slots
+        """
+        self.failure_threshold = failure_threshold
+        self.failure_ratio = failure_ratio
+        self.window_seconds = window_seconds
+        self.reset_timeout = reset_timeout
+        self.probe_limit = probe_limit
+        self.probe_timeout = probe_timeout
+        self.state = CircuitState.CLOSED
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._failures = 0
+        self._total = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+
+    def allow_request(self) -> bool:
+        """Return whether a request to the upstream should be attempted.
+
+        While half-open, a True answer claims a probe slot; the caller must then
+        report the outcome with record_success or record_failure.
+        """
+        if self.state is CircuitState.CLOSED:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            if self.state is CircuitState.OPEN:
+                if now - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+                self._probes = 0
+            if self.state is CircuitState.HALF_OPEN:
+                if self._probes >= self.probe_limit:
+                    if now - self._probe_started < self.probe_timeout:
+                        return False
+                    # The probes never reported back; give their slots back
+                    self._probes = 0
+                self._probes += 1
+                self._probe_started = now
+            return True
+
+    def is_available(self) -> bool:
+        """Return whether allow_request would currently let a request through.
+
+        Unlike allow_request this only reads state, so it never claims a probe slot.
+        """
+        if self.state is CircuitState.CLOSED:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            if self.state is CircuitState.OPEN:
+                return now - self._opened_at >= self.reset_timeout
+            if self.state is CircuitState.HALF_OPEN:
+                return (
+                    self._probes < self.probe_limit
+                    or now - self._probe_started >= self.probe_timeout
+                )
+            return True
+
+    def is_idle(self) -> bool:
+        """Return whether the breaker is closed with no failures in a live window.
+
+        Such a breaker holds no state worth keeping and can be dropped.
+        """
+        return self.state is CircuitState.CLOSED and (
+            self._failures == 0
+            or time.monotonic() - self._window_start >= self.window_seconds
+        )
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        with self._lock:
+            if self.state is not CircuitState.CLOSED:
+                self._close()
+                return
+            self._count(failed=False)
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if the window trips."""
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                self._open()
+                return
+            if self.state is CircuitState.OPEN:
+                # A failure after the cooldown means the upstream is still (or
+                # again) down even though no probe was claimed; restart the cooldown
+                if time.monotonic() - self._opened_at >= self.reset_timeout:
+                    self._open()
+                return
+            self._count(failed=True)
+            if (
+                self._total >= self.failure_threshold
+                and self._failures >= self._total * self.failure_ratio
+            ):
+                self._open()
+
+    def _count(self, failed: bool) -> None:
+        """Add one outcome to the current window, starting a new one if expired."""
+        now = time.monotonic()
+        if now - self._window_start >= self.window_seconds:
+            self._window_start = now
+            self._failures = 0
+            self._total = 0
+        self._total += 1
+        if failed:
+            self._failures += 1
+
+    def _open(self) -> None:
+        """Trip the circuit."""
+        self.state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+
+    def _close(self) -> None:
+        """Close the circuit with a fresh window."""
+        self.state = CircuitState.CLOSED
+        self._window_start = time.monotonic()
+        self._failures = 0
+        self._total = 0
+
+
 class NetworkErrorHandler:
     """Handles network-related errors with timeout and retry support."""
 
+    __slots__ = (
+        "logger",
+        "error_handler",
+        "default_timeout",
+        "max_retries",
+        "retry_delay",
+        "max_retry_delay",
+        "jitter",
+        "_breakers",
+        "_breakers_lock",
+    )
+
     def __init__(
         self,
         logger: logging.Logger | None = None,
         default_timeout: float = 30.0,
         max_retries: int = 0,
         retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+        jitter: bool = True,
     ) -> None:
         """Initialize network error handler.
 
@@ -30,17 +257,32 @@ class NetworkErrorHandler:
             logger: Optional logger instance
             default_timeout: Default timeout in seconds for network operations
             max_retries: Maximum number of retry attempts (0 = no retries)
-            retry_delay: Delay in seconds between retry attempts
+            retry_delay: Base delay in seconds before the first retry; doubles on
+                each further retry
+            max_retry_delay: Upper bound in seconds for the backoff delay
+            jitter: Sleep a random time between 0 and the backoff delay ("full
+                jitter") so workers retrying the same outage don't wake in sync
         """
         self.logger = logger or logging.getLogger(__name__)
         self.error_handler = ErrorHandler(self.logger)
         self.default_timeout = default_timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.jitter = jitter
+        # Circuit breakers keyed by target URL, created on first use and capped
+        # at _MAX_BREAKERS entries
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
 
         self.logger.info(
-            f"NetworkErrorHandler initialized with timeout={default_timeout}s, "
-            f"max_retries={max_retries}, retry_delay={retry_delay}s"
+            "NetworkErrorHandler initialized with timeout=%ss, max_retries=%d, "
+            "retry_delay=%ss, max_retry_delay=%ss, jitter=%s",
+            default_timeout,
+            max_retries,
+            retry_delay,
+            max_retry_delay,
+            jitter,
         )
 
     def handle_connection_error(
@@ -59,9 +301,11 @@ class NetworkErrorHandler:
         Returns:
             HTTP error response as bytes
         """
-        additional_context = {"target_url": target_url}
-        if context:
-            additional_context.update(context)
+        additional_context = (
+            {"target_url": target_url, **context} if context else {"target_url": target_url}
+        )
+
+        self.get_circuit_breaker(target_url).record_failure()
 
         error_code = ErrorCode.NETWORK_CONNECTION_FAILED
         details = f"Failed to connect to {target_url}: {str(error)}"
@@ -90,18 +334,17 @@ class NetworkErrorHandler:
         Returns:
             HTTP error response as bytes
         """
-        additional_context = {
-            "target_url": target_url,
-            "timeout": timeout or self.default_timeout,
-        }
-        if context:
-            additional_context.update(context)
+        timeout = timeout or self.default_timeout
+        additional_context: dict[str, Any] = (
+            {"target_url": target_url, "timeout": timeout, **context}
+            if context
+            else {"target_url": target_url, "timeout": timeout}
+        )
+
+        self.get_circuit_breaker(target_url).record_failure()
 
         error_code = ErrorCode.NETWORK_TIMEOUT
-        details = (
-            f"Request to {target_url} timed out after "
-            f"{timeout or self.default_timeout} seconds: {str(error)}"
-        )
+        details = f"Request to {target_url} timed out after {timeout} seconds: {error}"
 
         self.error_handler.log_error(error_code, details, error, additional_context)
 
@@ -125,9 +368,9 @@ class NetworkErrorHandler:
         Returns:
             HTTP error response as bytes
         """
-        additional_context = {"target_url": target_url}
-        if context:
-            additional_context.update(context)
+        additional_context = (
+            {"target_url": target_url, **context} if context else {"target_url": target_url}
+        )
 
         error_code = ErrorCode.NETWORK_UPSTREAM_UNAVAILABLE
         details = f"Upstream server {target_url} is unavailable"
@@ -146,6 +389,7 @@ class NetworkErrorHandler:
         operation_name: str,
         max_retries: int | None = None,
         retry_delay: float | None = None,
+        target_url: str | None = None,
     ) -> T:
         """Execute an operation with retry logic.
 
@@ -153,48 +397,160 @@ class NetworkErrorHandler:
             operation: The operation to execute
             operation_name: Name of the operation for logging
             max_retries: Maximum retry attempts (uses default if None)
-            retry_delay: Delay between retries (uses default if None)
+            retry_delay: Base backoff delay (uses default if None)
+            target_url: Upstream the operation talks to; when given, its circuit
+                breaker records each outcome and can short-circuit attempts
 
         Returns:
             Result of the operation
 
         Raises:
+            CircuitOpenError: If the target's circuit breaker rejects an attempt
             Exception: The last exception if all retries fail
         """
         max_attempts = (
             max_retries if max_retries is not None else self.max_retries
         ) + 1
         delay = retry_delay if retry_delay is not None else self.retry_delay
+        breaker = self.get_circuit_breaker(target_url) if target_url else None
 
         last_exception = None
 
         for attempt in range(1, max_attempts + 1):
+            if breaker is not None and not breaker.allow_request():
+                self.logger.warning(
+                    "%s skipped: circuit open for %s", operation_name, target_url
+                )
+                raise CircuitOpenError(f"Circuit open for {target_url}")
             try:
                 self.logger.debug(
-                    f"Executing {operation_name} (attempt {attempt}/{max_attempts})"
+                    "Executing %s (attempt %d/%d)",
+                    operation_name,
+                    attempt,
+                    max_attempts,
                 )
                 result = operation()
+                if breaker is not None:
+                    breaker.record_success()
                 if attempt > 1:
-                    self.logger.info(f"{operation_name} succeeded on attempt {attempt}")
+                    self.logger.info(
+                        "%s succeeded on attempt %d", operation_name, attempt
+                    )
                 return result
 
             except Exception as e:
                 last_exception = e
+                if breaker is not None:
+                    breaker.record_failure()
                 self.logger.warning(
-                    f"{operation_name} failed on attempt {attempt}/{max_attempts}: {str(e)}"
+                    "%s failed on attempt %d/%d: %s",
+                    operation_name,
+                    attempt,
+                    max_attempts,
+                    e,
                 )
 
                 # Don't sleep after the last attempt
                 if attempt < max_attempts:
-                    self.logger.debug(f"Retrying after {delay} seconds...")
-                    time.sleep(delay)
+                    sleep_for = self._backoff_delay(delay, attempt)
+                    self.logger.debug("Retrying after %.3f seconds...", sleep_for)
+                    time.sleep(sleep_for)
 
         # All retries exhausted
-        self.logger.error(f"{operation_name} failed after {max_attempts} attempts")
+        self.logger.error("%s failed after %d attempts", operation_name, max_attempts)
         if last_exception:
             raise last_exception
         raise RuntimeError(f"{operation_name} failed after all retry attempts")
 
+    async def execute_with_retry_async(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        operation_name: str,
+        max_retries: int | None = None,
+        retry_delay: float | None = None,
+        timeout: float | None = None,
+        target_url: str | None = None,
+    ) -> T:
+        """Execute an async operation with per-attempt timeout and retry logic.
+
+        Async counterpart of execute_with_retry: backoff waits use asyncio.sleep,
+        so the event loop keeps serving other connections while retrying.
+
+        Args:
+            operation: Factory returning a fresh awaitable for each attempt
+            operation_name: Name of the operation for logging
+            max_retries: Maximum retry attempts (uses default if None)
+            retry_delay: Base backoff delay (uses default if None)
+            timeout: Timeout in seconds per attempt (uses default if None)
+            target_url: Upstream the operation talks to; when given, its circuit
+                breaker records each outcome and can short-circuit attempts
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            CircuitOpenError: If the target's circuit breaker rejects an attempt
+            Exception: The last exception if all retries fail
+        """
+        max_attempts = (
+            max_retries if max_retries is not None else self.max_retries
+        ) + 1
+        delay = retry_delay if retry_delay is not None else self.retry_delay
+        timeout_value = timeout if timeout is not None else self.default_timeout
+        breaker = self.get_circuit_breaker(target_url) if target_url else None
+
+        last_exception: Exception | None = None
+
+        for attempt in range(1, max_attempts + 1):
+            if breaker is not None and not breaker.allow_request():
+                self.logger.warning(
+                    "%s skipped: circuit open for %s", operation_name, target_url
+                )
+                raise CircuitOpenError(f"Circuit open for {target_url}")
+            try:
+                result = await asyncio.wait_for(operation(), timeout_value)
+                if breaker is not None:
+                    breaker.record_success()
+                if attempt > 1:
+                    self.logger.info(
+                        "%s succeeded on attempt %d", operation_name, attempt
+                    )
+                return result
+
+            except Exception as e:
+                last_exception = e
+                if breaker is not None:
+                    breaker.record_failure()
+                self.logger.warning(
+                    "%s failed on attempt %d/%d: %r",
+                    operation_name,
+                    attempt,
+                    max_attempts,
+                    e,
+                )
+
+                if attempt < max_attempts:
+                    await asyncio.sleep(self._backoff_delay(delay, attempt))
+
+        self.logger.error("%s failed after %d attempts", operation_name, max_attempts)
+        if last_exception:
+            raise last_exception
+        raise RuntimeError(f"{operation_name} failed after all retry attempts")
+
+    def _backoff_delay(self, base_delay: float, attempt: int) -> float:
+        """Compute the sleep before the retry that follows a failed attempt.
+
+        Args:
+            base_delay: Delay before the first retry
+            attempt: The attempt number that just failed (1-based)
+
+        Returns:
+            Delay in seconds: exponential backoff capped at max_retry_delay,
+            randomized over [0, backoff] when jitter is enabled
+        """
+        backoff = min(self.max_retry_delay, base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
     def execute_with_timeout(
         self,
         operation: Callable[[], T],
@@ -203,8 +559,9 @@ class NetworkErrorHandler:
     ) -> T:
         """Execute an operation with timeout.
 
-        Note: This is a basic implementation. For true timeout support,
-        consider using threading or asyncio with timeout mechanisms.
+        The operation runs on its own daemon thread, and the caller waits at most
+        timeout seconds for it. A timed-out operation cannot be interrupted; it
+        keeps running on that thread and its result is discarded.
 
         Args:
             operation: The operation to execute
@@ -220,20 +577,28 @@ class NetworkErrorHandler:
         """
         timeout_value = timeout if timeout is not None else self.default_timeout
 
-        self.logger.debug(f"Executing {operation_name} with timeout={timeout_value}s")
+        self.logger.debug(
+            "Executing %s with timeout=%ss", operation_name, timeout_value
+        )
 
-        # Note: This is a simplified implementation
-        # For production use, consider using threading.Timer or asyncio.wait_for
+        future = _start_timed_operation(operation)
         try:
-            result = operation()
-            return result
-        except TimeoutError:
+            return future.result(timeout=timeout_value)
+        except concurrent.futures.TimeoutError:
+            # Same class as the builtin TimeoutError, so tell the wait timing out
+            # apart from the operation raising TimeoutError itself
+            error = future.exception() if future.done() else None
+            if error is not None:
+                self.logger.error("%s failed: %s", operation_name, error)
+                raise
             self.logger.error(
-                f"{operation_name} timed out after {timeout_value} seconds"
+                "%s timed out after %s seconds", operation_name, timeout_value
             )
-            raise
+            raise TimeoutError(
+                f"{operation_name} timed out after {timeout_value} seconds"
+            ) from None
         except Exception as e:
-            self.logger.error(f"{operation_name} failed: {str(e)}")
+            self.logger.error("%s failed: %s", operation_name, e)
             raise
 
     def check_upstream_availability(
@@ -241,8 +606,9 @@ class NetworkErrorHandler:
     ) -> bool:
         """Check if upstream server is available.
 
-        This is a basic availability check. For production use,
-        consider implementing health check endpoints.
+        Answers from the target's circuit breaker without any network I/O: the
+        upstream is assumed available unless recent failures opened the circuit.
+        This is a read-only check and never claims a half-open probe slot.
 
         Args:
             target_url: The target URL to check
@@ -254,21 +620,64 @@ class NetworkErrorHandler:
         timeout_value = timeout if timeout is not None else self.default_timeout
 
         self.logger.debug(
-            f"Checking upstream availability: {target_url} (timeout={timeout_value}s)"
+            "Checking upstream availability: %s (timeout=%ss)",
+            target_url,
+            timeout_value,
         )
 
-        # This is a placeholder for actual availability checking
-        # In a real implementation, you might:
-        # 1. Send a HEAD request to a health check endpoint
-        # 2. Check DNS resolution
-        # 3. Attempt a TCP connection
-        # 4. Check response time
+        if not self.get_circuit_breaker(target_url).is_available():
+            self.logger.debug("Upstream %s unavailable: circuit open", target_url)
+            return False
 
-        # For now, we'll just log and return True
         # The actual connection attempt will reveal availability
-        self.logger.debug(f"Upstream {target_url} assumed available")
+        self.logger.debug("Upstream %s assumed available", target_url)
         return True
 
+    def record_success(self, target_url: str) -> None:
+        """Record a successful request to an upstream.
+
+        Callers that report failures through handle_connection_error or
+        handle_timeout_error should report successes here, so that a half-open
+        circuit can close again.
+
+        Args:
+            target_url: The target URL that responded successfully
+        """
+        breaker = self._breakers.get(target_url)
+        if breaker is not None:
+            breaker.record_success()
+
+    def get_circuit_breaker(self, target_url: str) -> CircuitBreaker:
+        """Get the circuit breaker for an upstream, creating it on first use.
+
+        Args:
+            target_url: The target URL
+
+        Returns:
+            Circuit breaker shared by all requests to target_url
+        """
+        breaker = self._breakers.get(target_url)
+        if breaker is None:
+            with self._breakers_lock:
+                breaker = self._breakers.get(target_url)
+                if breaker is None:
+                    if len(self._breakers) >= _MAX_BREAKERS:
+                        self._evict_breakers()
+                    breaker = self._breakers[target_url] = CircuitBreaker()
+        return breaker
+
+    def _evict_breakers(self) -> None:
+        """Make room for a new breaker. Must be called with _breakers_lock held.
+
+        Idle breakers are dropped first; breakers that are tripped or counting
+        recent failures are kept, and if none are idle the oldest one goes.
+        """
+        breakers = self._breakers
+        for url in [u for u, b in breakers.items() if b.is_idle()]:
+            del breakers[url]
+        if len(breakers) >= _MAX_BREAKERS:
+            del breakers[next(iter(breakers))]
+
     def get_retry_config(self) -> dict[str, Any]:
         """Get current retry configuration.
 
@@ -278,6 +687,8 @@ class NetworkErrorHandler:
         return {
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
+            "max_retry_delay": self.max_retry_delay,
+            "jitter": self.jitter,
             "default_timeout": self.default_timeout,
         }
 
@@ -296,12 +707,12 @@ class NetworkErrorHandler:
         """
         if max_retries is not None:
             self.max_retries = max_retries
-            self.logger.info(f"Updated max_retries to {max_retries}")
+            self.logger.info("Updated max_retries to %d", max_retries)
 
         if retry_delay is not None:
             self.retry_delay = retry_delay
-            self.logger.info(f"Updated retry_delay to {retry_delay}s")
+            self.logger.info("Updated retry_delay to %ss", retry_delay)
 
         if default_timeout is not None:
             self.default_timeout = default_timeout
-            self.logger.info(f"Updated default_timeout to {default_timeout}s")
+            self.logger.info("Updated default_timeout to %ss", default_timeout)
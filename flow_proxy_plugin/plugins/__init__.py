@@ -1,7 +1,22 @@
 """Plugin implementations."""
 
-from .base_plugin import BaseFlowProxyPlugin
-from .proxy_plugin import FlowProxyPlugin
-from .web_server_plugin import FlowProxyWebServerPlugin
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base_plugin import BaseFlowProxyPlugin
+    from .proxy_plugin import FlowProxyPlugin
+    from .web_server_plugin import FlowProxyWebServerPlugin
+
+# Resolved lazily (PEP 562): the plugins import ProcessServices, which in turn
+# imports plugins.request_filter, so eager imports here form a cycle
+_LAZY_IMPORTS = {
+    "BaseFlowProxyPlugin": ".base_plugin",
+    "FlowProxyPlugin": ".proxy_plugin",
+    "FlowProxyWebServerPlugin": ".web_server_plugin",
+}
 
 __all__ = ["BaseFlowProxyPlugin", "FlowProxyPlugin", "FlowProxyWebServerPlugin"]
+
+__getattr__ = lazy_exports(globals(), _LAZY_IMPORTS)
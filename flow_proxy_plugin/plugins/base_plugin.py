@@ -6,6 +6,22 @@ from ..utils.log_context import component_context
 from ..utils.process_services import ProcessServices
 
 
+def decode_bytes(value: bytes | str) -> str:
+    """Safely decode bytes to string."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def extract_header_value(header_value: Any) -> str:
+    """Extract actual value from header tuple or bytes."""
+    # Same isinstance checks as decode_bytes, so tuple and bytes subclasses are
+    # unwrapped too; str values skip the str() call
+    if isinstance(header_value, tuple):
+        header_value = header_value[0]
+    if isinstance(header_value, bytes):
+        return header_value.decode()
+    return header_value if isinstance(header_value, str) else str(header_value)
+
+
 class BaseFlowProxyPlugin:
     """Mixin for Flow Proxy plugins. Provides shared service references and utilities.
 
@@ -38,40 +54,37 @@ class BaseFlowProxyPlugin:
 
     def _get_config_and_token(self) -> tuple[dict[str, Any], str, str]:
         """Get next config and generate JWT token with failover support."""
+        load_balancer = self.load_balancer
+        jwt_generator = self.jwt_generator
         with component_context("LB"):
-            config = self.load_balancer.get_next_config()
-        config_name = config.get("name", config.get("clientId", "unknown"))
+            config = load_balancer.get_next_config()
+        config_name = self._config_name(config)
         try:
             with component_context("JWT"):
-                jwt_token = self.jwt_generator.generate_token(config)
+                jwt_token = jwt_generator.generate_token(config)
             return config, config_name, jwt_token
         except ValueError as e:
             self.logger.error(
                 "Token generation failed for '%s': %s", config_name, str(e)
             )
             with component_context("LB"):
-                self.load_balancer.mark_config_failed(config)
-                config = self.load_balancer.get_next_config()
-            config_name = config.get("name", config.get("clientId", "unknown"))
+                load_balancer.mark_config_failed(config)
+                config = load_balancer.get_next_config()
+            config_name = self._config_name(config)
             with component_context("JWT"):
-                jwt_token = self.jwt_generator.generate_token(config)
+                jwt_token = jwt_generator.generate_token(config)
             self.logger.info("Failover successful - using '%s'", config_name)
             return config, config_name, jwt_token
 
     @staticmethod
-    def _decode_bytes(value: bytes | str) -> str:
-        """Safely decode bytes to string."""
-        return value.decode() if isinstance(value, bytes) else value
+    def _config_name(config: dict[str, Any]) -> str:
+        """Return the config's display name, falling back to its clientId."""
+        # Only look up clientId when there is no name
+        if "name" in config:
+            return config["name"]
+        return config.get("clientId", "unknown")
 
-    @staticmethod
-    def _extract_header_value(header_value: Any) -> str:
-        """Extract actual value from header tuple or bytes."""
-        if isinstance(header_value, tuple):
-            actual_value = header_value[0]
-        else:
-            actual_value = header_value
-        return (
-            actual_value.decode()
-            if isinstance(actual_value, bytes)
-            else str(actual_value)
-        )
+    # Plain functions bound as staticmethods; hot loops can call the module-level
+    # helpers directly and skip the attribute lookup
+    _decode_bytes = staticmethod(decode_bytes)
+    _extract_header_value = staticmethod(extract_header_value)
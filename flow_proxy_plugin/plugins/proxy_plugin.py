@@ -1,5 +1,6 @@
 """Main FlowProxyPlugin class implementation."""
 
+import logging
 import os
 import secrets
 import threading
@@ -15,6 +16,7 @@ from .base_plugin import BaseFlowProxyPlugin
 _proxy_pool: Optional["PluginPool[FlowProxyPlugin]"] = None
 _proxy_pool_lock = threading.Lock()
 _PROXY_POOL_SIZE = int(os.getenv("FLOW_PROXY_PLUGIN_POOL_SIZE", "64"))
+_FULL_URL_PREFIXES = (b"http://", b"https://")
 
 
 class FlowProxyPlugin(HttpProxyBasePlugin, BaseFlowProxyPlugin):
@@ -96,35 +98,42 @@ class FlowProxyPlugin(HttpProxyBasePlugin, BaseFlowProxyPlugin):
         """
         req_id = secrets.token_hex(3)
         set_request_context(req_id, "PROXY")
+        # Local names for the hot path; read per call so swapped services are honored
+        logger = self.logger
+        forwarder = self.request_forwarder
         try:
             # Convert reverse proxy requests to forward proxy format
             self._convert_reverse_proxy_request(request)
 
             # Validate request
-            if not self.request_forwarder.validate_request(request):
-                self.logger.error("Request validation failed")
+            if not forwarder.validate_request(request):
+                logger.error("Request validation failed")
                 return None
 
             # Get config and token with failover
             _, config_name, jwt_token = self._get_config_and_token()
 
             # Modify request headers
-            modified_request = self.request_forwarder.modify_request_headers(
+            modified_request = forwarder.modify_request_headers(
                 request, jwt_token, config_name
             )
 
-            # Log success
-            method = self._decode_bytes(request.method) if request.method else "GET"
-            path = self._decode_bytes(request.path) if request.path else "unknown"
-            self.logger.info("→ %s %s [%s]", method, path, config_name)
+            # Log success; skip decoding method/path when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "→ %s %s [%s]",
+                    self._decode_bytes(request.method) if request.method else "GET",
+                    self._decode_bytes(request.path) if request.path else "unknown",
+                    config_name,
+                )
 
             return modified_request
 
         except (RuntimeError, ValueError) as e:
-            self.logger.error("Request processing failed: %s", str(e))
+            logger.error("Request processing failed: %s", e)
             return None
         except Exception as e:
-            self.logger.error("Unexpected error: %s", str(e), exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
             return None
         finally:
             clear_request_context()
@@ -139,17 +148,20 @@ class FlowProxyPlugin(HttpProxyBasePlugin, BaseFlowProxyPlugin):
             return
 
         # Check if it's already a full URL
-        if request.path.startswith(b"http://") or request.path.startswith(b"https://"):
+        if request.path.startswith(_FULL_URL_PREFIXES):
             return
 
-        # Convert path-only request to full URL
-        original_path = self._decode_bytes(request.path)
-        target_url = f"{self.request_forwarder.target_base_url}{original_path}"
-        request.set_url(target_url.encode())
+        # Convert path-only request to full URL without a decode/encode round trip
+        original_path = request.path
+        target_url = self.request_forwarder.target_base_url_bytes + original_path
+        request.set_url(target_url)
 
-        self.logger.debug(
-            "Converted reverse proxy request: %s → %s", original_path, target_url
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Converted reverse proxy request: %s → %s",
+                self._decode_bytes(original_path),
+                self._decode_bytes(target_url),
+            )
 
     def handle_client_request(self, request: HttpParser) -> HttpParser | None:
         """Handle client request and add authentication information.
@@ -176,14 +188,20 @@ class FlowProxyPlugin(HttpProxyBasePlugin, BaseFlowProxyPlugin):
         Returns:
             Unmodified chunk for transparent pass-through
         """
-        try:
-            if chunk:
-                self.logger.debug("Received upstream chunk: %d bytes", len(chunk))
-                return self.request_forwarder.handle_response_chunk(chunk)
-
+        if not chunk:
             self.logger.debug("Received empty chunk from upstream")
             return chunk
 
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Received upstream chunk: %d bytes", len(chunk))
+
+        # Hand the original memoryview straight back unless the forwarder
+        # needs to see the data
+        if self.request_forwarder.passthrough_response_chunks:
+            return chunk
+
+        try:
+            return self.request_forwarder.handle_response_chunk(chunk)
         except Exception as e:
             self.logger.error(
                 "Error handling upstream chunk: %s", str(e), exc_info=True
@@ -206,16 +224,16 @@ class FlowProxyPlugin(HttpProxyBasePlugin, BaseFlowProxyPlugin):
             Modified context with plugin information
         """
         try:
-            context.update(
-                {
-                    "plugin": "FlowProxyPlugin",
-                    "load_balancer_stats": {
-                        "available_configs": self.load_balancer.available_count,
-                        "failed_configs": self.load_balancer.failed_count,
-                        "total_requests": self.load_balancer.total_requests,
-                    },
-                }
-            )
+            # Assign keys directly rather than building a throwaway dict for update().
+            # The stats dict stays per-call: proxy.py hands context to access_log
+            # and other plugins, which may keep a reference to it.
+            load_balancer = self.load_balancer
+            context["plugin"] = "FlowProxyPlugin"
+            context["load_balancer_stats"] = {
+                "available_configs": load_balancer.available_count,
+                "failed_configs": load_balancer.failed_count,
+                "total_requests": load_balancer.total_requests,
+            }
 
             self.logger.debug("Access log: %s", context)
             return context
@@ -21,7 +21,7 @@ from ..utils.log_context import (
 )
 from ..utils.plugin_pool import PluginPool
 from ..utils.process_services import ProcessServices
-from .base_plugin import BaseFlowProxyPlugin
+from .base_plugin import BaseFlowProxyPlugin, decode_bytes, extract_header_value
 from .request_filter import FilterRule
 
 _web_pool: Optional["PluginPool[FlowProxyWebServerPlugin]"] = None
@@ -362,11 +362,9 @@ class FlowProxyWebServerPlugin(HttpWebServerBasePlugin, BaseFlowProxyPlugin):
         skip_headers = self.request_filter.get_headers_to_skip(filter_rule)
 
         for header_name, header_value in request.headers.items():
-            name = self._decode_bytes(header_name).lower()
-            if name not in skip_headers:
-                headers[self._decode_bytes(header_name)] = self._extract_header_value(
-                    header_value
-                )
+            name = decode_bytes(header_name)
+            if name.lower() not in skip_headers:
+                headers[name] = extract_header_value(header_value)
 
         return headers
 
@@ -1,5 +1,8 @@
 """Utility modules."""
 
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
 from .log_context import (
     clear_request_context,
     component_context,
@@ -18,8 +21,16 @@ from .logging import (
     setup_colored_logger,
     setup_logging,
 )
-from .plugin_pool import PluginPool
-from .process_services import ProcessServices
+
+if TYPE_CHECKING:
+    from .plugin_pool import PluginPool
+    from .process_services import ProcessServices
+
+# Resolved lazily (PEP 562): ProcessServices pulls in httpx and every core component
+_LAZY_IMPORTS = {
+    "PluginPool": ".plugin_pool",
+    "ProcessServices": ".process_services",
+}
 
 __all__ = [
     "clear_request_context",
@@ -37,3 +48,5 @@ __all__ = [
     "PluginPool",
     "ProcessServices",
 ]
+
+__getattr__ = lazy_exports(globals(), _LAZY_IMPORTS)
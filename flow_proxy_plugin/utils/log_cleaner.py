@@ -61,8 +61,9 @@ class LogCleaner:
         self._thread = threading.Thread(target=self._cleanup_loop, daemon=True)
         self._thread.start()
         logger.info(
-            f"日志清理任务已启动，保留 {self.retention_days} 天，"
-            f"每 {self.cleanup_interval_hours} 小时清理一次"
+            "日志清理任务已启动，保留 %s 天，每 %s 小时清理一次",
+            self.retention_days,
+            self.cleanup_interval_hours,
         )
 
     def stop(self) -> None:
@@ -87,7 +88,7 @@ class LogCleaner:
             try:
                 self.cleanup_logs()
             except Exception as e:
-                logger.error(f"日志清理失败: {e}", exc_info=True)
+                logger.error("日志清理失败: %s", e, exc_info=True)
 
     def cleanup_logs(self) -> dict:
         """清理过期的日志文件。
@@ -96,14 +97,16 @@ class LogCleaner:
             清理结果统计，包含删除的文件数量和释放的空间
         """
         if not self.log_dir.exists():
-            logger.warning(f"日志目录不存在: {self.log_dir}")
+            logger.warning("日志目录不存在: %s", self.log_dir)
             return {"deleted_files": 0, "freed_space_mb": 0}
 
         deleted_files = 0
         freed_space = 0
         cutoff_time = datetime.now() - timedelta(days=self.retention_days)
 
-        logger.info(f"开始清理日志，删除 {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')} 之前的文件")
+        logger.info(
+            "开始清理日志，删除 %s 之前的文件", cutoff_time.strftime("%Y-%m-%d %H:%M:%S")
+        )
 
         # 按修改时间清理
         for log_file in self.log_dir.glob("*.log*"):
@@ -116,9 +119,9 @@ class LogCleaner:
                     log_file.unlink()
                     deleted_files += 1
                     freed_space += file_size
-                    logger.debug(f"删除过期日志文件: {log_file.name}")
+                    logger.debug("删除过期日志文件: %s", log_file.name)
             except Exception as e:
-                logger.error(f"删除日志文件 {log_file} 失败: {e}")
+                logger.error("删除日志文件 %s 失败: %s", log_file, e)
 
         # 按总大小清理（如果设置了限制）
         if self.max_size_mb > 0:
@@ -127,7 +130,9 @@ class LogCleaner:
             freed_space += freed
 
         freed_space_mb = freed_space / (1024 * 1024)
-        logger.info(f"日志清理完成: 删除 {deleted_files} 个文件，释放 {freed_space_mb:.2f} MB 空间")
+        logger.info(
+            "日志清理完成: 删除 %d 个文件，释放 %.2f MB 空间", deleted_files, freed_space_mb
+        )
 
         return {
             "deleted_files": deleted_files,
@@ -155,7 +160,7 @@ class LogCleaner:
                 log_files.append((log_file, stat.st_size, stat.st_mtime))
                 total_size += stat.st_size
             except Exception as e:
-                logger.error(f"获取文件信息失败 {log_file}: {e}")
+                logger.error("获取文件信息失败 %s: %s", log_file, e)
 
         # 如果总大小未超过限制，无需清理
         if total_size <= max_size_bytes:
@@ -166,8 +171,9 @@ class LogCleaner:
 
         # 删除最旧的文件直到满足大小限制
         logger.info(
-            f"日志目录大小 {total_size / (1024 * 1024):.2f} MB 超过限制 "
-            f"{self.max_size_mb} MB，开始清理最旧的文件"
+            "日志目录大小 %.2f MB 超过限制 %s MB，开始清理最旧的文件",
+            total_size / (1024 * 1024),
+            self.max_size_mb,
         )
 
         for log_file, size, _ in log_files:
@@ -179,9 +185,9 @@ class LogCleaner:
                 deleted_files += 1
                 freed_space += size
                 total_size -= size
-                logger.debug(f"删除日志文件以满足大小限制: {log_file.name}")
+                logger.debug("删除日志文件以满足大小限制: %s", log_file.name)
             except Exception as e:
-                logger.error(f"删除日志文件 {log_file} 失败: {e}")
+                logger.error("删除日志文件 %s 失败: %s", log_file, e)
 
         return deleted_files, freed_space
 
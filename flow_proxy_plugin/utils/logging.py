@@ -1,15 +1,48 @@
 """Logging utilities with colored output and daily rotation."""
 
+import atexit
 import logging
+import multiprocessing.util
 import os
+import queue
 import sys
 from dataclasses import dataclass
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from typing import ClassVar
 
 from .log_context import get_request_prefix
 
+# Level name -> numeric level, snapshotted once instead of getattr(logging, ...) per call.
+# Includes the stdlib aliases that getattr(logging, name) also accepted.
+_LEVELS: dict[str, int] = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARN,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.FATAL,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+def _level_from_name(level: str) -> int:
+    """Return the numeric log level for a level name, defaulting to INFO."""
+    return _LEVELS.get(level if level.isupper() else level.upper(), logging.INFO)
+
+
+# FLOW_PROXY_LOG_LEVEL resolved on first use, shared process-wide
+_env_log_level: str | None = None
+
+
+def env_log_level() -> str:
+    """Return FLOW_PROXY_LOG_LEVEL (default INFO), reading the environment once per process."""
+    global _env_log_level
+    if _env_log_level is None:
+        _env_log_level = os.getenv("FLOW_PROXY_LOG_LEVEL", "INFO")
+    return _env_log_level
+
 
 # ANSI color codes
 class Colors:
@@ -58,6 +91,58 @@ class RequestContextFilter(logging.Filter):
         return True
 
 
+_file_listener: QueueListener | None = None
+
+
+def _stop_file_listener() -> None:
+    """Stop the background file listener, flushing queued records."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+def _restart_file_listener_after_fork() -> None:
+    """Give the child process a fresh queue and writer thread.
+
+    The parent's listener thread does not survive fork(), so records queued by
+    the child would otherwise never reach the file.
+    """
+    global _file_listener
+    listener = _file_listener
+    if listener is None:
+        return
+    fresh_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    for handler in logging.root.handlers:
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            handler.queue = fresh_queue
+    _file_listener = QueueListener(
+        fresh_queue, *listener.handlers, respect_handler_level=True
+    )
+    _file_listener.start()
+
+
+def _flush_file_listener_at_worker_exit(_module: object) -> None:
+    """Flush the child's listener when a multiprocessing worker exits.
+
+    Worker processes leave through os._exit(), which skips atexit, but
+    multiprocessing still runs its own finalizers first.
+    """
+    if _file_listener is not None:
+        multiprocessing.util.Finalize(None, _stop_file_listener, exitpriority=0)
+
+
+atexit.register(_stop_file_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_file_listener_after_fork)
+# Runs in multiprocessing children after their finalizer registry is reset
+multiprocessing.util.register_after_fork(
+    sys.modules[__name__], _flush_file_listener_at_worker_exit
+)
+
+
 @dataclass
 class FormatConfig:
     """Log format configuration."""
@@ -133,7 +218,7 @@ class LogConfig:
     @property
     def log_level(self) -> int:
         """Get logging level as integer."""
-        return getattr(logging, self.level.upper(), logging.INFO)
+        return _level_from_name(self.level)
 
     @property
     def log_dir_path(self) -> Path:
@@ -194,16 +279,32 @@ class LogSetup:
         self.config.log_dir_path.mkdir(parents=True, exist_ok=True)
 
     def configure_root_logger(self) -> None:
-        """Configure root logger with console and file handlers."""
+        """Configure root logger with console and file handlers.
+
+        File writes are handed off to a background ``QueueListener`` so that
+        logging threads never block on disk I/O.
+        """
+        global _file_listener
+        _stop_file_listener()
+
         console_handler = LoggerFactory.create_console_handler(self.config)
         file_handler = LoggerFactory.create_file_handler(self.config)
 
+        # Unbounded, so enqueueing never blocks and no record is ever dropped
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        queue_handler = QueueHandler(log_queue)
+        # Only merge args into the message here; the file handler applies the layout
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
         logging.basicConfig(
             level=self.config.log_level,
-            handlers=[console_handler, file_handler],
+            handlers=[console_handler, queue_handler],
             force=True,  # Override any existing configuration
         )
 
+        _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
+
     def initialize_cleaner(self) -> None:
         """Initialize log cleaner for automatic cleanup."""
         from .log_cleaner import init_log_cleaner
@@ -264,7 +365,7 @@ def setup_colored_logger(
         >>> logger = logging.getLogger(__name__)
         >>> setup_colored_logger(logger, log_level="DEBUG")
     """
-    level = getattr(logging, log_level.upper(), logging.INFO)
+    level = _level_from_name(log_level)
     logger.setLevel(level)
 
     # Clear existing handlers and filters (reset to clean state)
@@ -313,7 +414,7 @@ def setup_file_handler_for_child_process(
 
     # Create NEW file handler (not copy from parent)
     file_handler = LoggerFactory.create_file_handler(config)
-    file_handler.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    file_handler.setLevel(_level_from_name(log_level))
 
     # Add file handler to logger (avoid duplicates)
     for handler in logger.handlers:
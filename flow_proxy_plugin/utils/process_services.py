@@ -13,7 +13,11 @@ from ..core.load_balancer import LoadBalancer
 from ..core.request_forwarder import RequestForwarder
 from ..plugins.request_filter import RequestFilter
 from .log_filter import setup_proxy_log_filters
-from .logging import setup_colored_logger, setup_file_handler_for_child_process
+from .logging import (
+    env_log_level,
+    setup_colored_logger,
+    setup_file_handler_for_child_process,
+)
 
 
 class ProcessServices:  # pylint: disable=too-many-instance-attributes
@@ -35,7 +39,7 @@ class ProcessServices:  # pylint: disable=too-many-instance-attributes
 
     def _initialize(self) -> None:
         """Initialize all process-level resources. Called exactly once per process."""
-        log_level = os.getenv("FLOW_PROXY_LOG_LEVEL", "INFO")
+        log_level = env_log_level()
         log_dir = os.getenv("FLOW_PROXY_LOG_DIR", "logs")
 
         self.logger = logging.getLogger("flow_proxy")
@@ -48,6 +52,8 @@ class ProcessServices:  # pylint: disable=too-many-instance-attributes
         self.configs = self.secrets_manager.load_secrets(secrets_file)
         self.load_balancer = LoadBalancer(self.configs, self.logger)
         self.jwt_generator = JWTGenerator(self.logger)
+        # Sign every config's token up front so first requests hit the cache
+        self.jwt_generator.generate_tokens(self.configs)
         self.request_forwarder = RequestForwarder(self.logger)
         self.request_filter = RequestFilter(self.logger)
         self._client_lock = threading.Lock()
@@ -1,8 +1,10 @@
 """Tests for CLI module."""
 
 import argparse
-import multiprocessing
 import os
+import signal
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,8 +14,8 @@ class TestCLI:
     """Test cases for CLI functionality."""
 
     def test_default_num_workers(self) -> None:
-        """Test that default num_workers is CPU count."""
-        from flow_proxy_plugin.cli import main
+        """Test that default num_workers is the available CPU count."""
+        from flow_proxy_plugin.cli import _default_num_workers, main
 
         with (
             patch("flow_proxy_plugin.cli.Proxy"),
@@ -36,7 +38,7 @@ class TestCLI:
 
                 # Should have --num-workers with CPU count
                 assert "--num-workers" in args
-                cpu_count = multiprocessing.cpu_count()
+                cpu_count = _default_num_workers()
                 assert str(cpu_count) in args
 
                 # Should have --threaded
@@ -188,6 +190,34 @@ class TestCLI:
                 idx = args.index("--num-workers")
                 assert args[idx + 1] == "6"
 
+    def test_env_defaults_and_cli_override(self) -> None:
+        """Test env vars provide defaults that command line flags override."""
+        from flow_proxy_plugin.cli import main
+
+        with (
+            patch("flow_proxy_plugin.cli.sleep_loop"),
+            patch("flow_proxy_plugin.cli.Path.exists", return_value=True),
+            patch.dict(
+                os.environ,
+                {
+                    "FLOW_PROXY_PORT": "9001",
+                    "FLOW_PROXY_HOST": "0.0.0.0",
+                    "FLOW_PROXY_CLIENT_TIMEOUT": "120",
+                },
+            ),
+            patch("sys.argv", ["flow-proxy-plugin", "--port", "9100"]),
+            patch("flow_proxy_plugin.cli.Proxy") as mock_proxy,
+        ):
+            try:
+                main()
+            except SystemExit:
+                pass
+
+            args = mock_proxy.call_args[1]["input_args"]
+            assert args[args.index("--port") + 1] == "9100"
+            assert args[args.index("--hostname") + 1] == "0.0.0.0"
+            assert args[args.index("--timeout") + 1] == "120"
+
     def test_env_threaded_disabled(self) -> None:
         """Test disabling threaded via environment variable."""
         from flow_proxy_plugin.cli import main
@@ -278,8 +308,10 @@ class TestCLI:
                 pass
 
             # Check that version was logged
-            calls = [str(call) for call in mock_log.info.call_args_list]
-            version_logged = any(f"v{__version__}" in str(call) for call in calls)
+            calls = [
+                call.args[0] % call.args[1:] for call in mock_log.info.call_args_list
+            ]
+            version_logged = any(f"v{__version__}" in call for call in calls)
             assert version_logged, (
                 f"Version not found in logs. __version__={__version__}"
             )
@@ -298,6 +330,62 @@ class TestCLI:
             parts = __version__.split(".")
             assert len(parts) >= 2, f"Invalid version format: {__version__}"
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="SIGTERM cannot be caught")
+    def test_sigterm_shuts_down_cleanly(self) -> None:
+        """Test that SIGTERM takes the Ctrl+C shutdown path and is then restored."""
+        from flow_proxy_plugin.cli import main
+
+        previous = signal.getsignal(signal.SIGTERM)
+        with (
+            patch("flow_proxy_plugin.cli.Proxy"),
+            patch(
+                "flow_proxy_plugin.cli.sleep_loop",
+                side_effect=lambda _: os.kill(os.getpid(), signal.SIGTERM),
+            ),
+            patch("flow_proxy_plugin.cli.Path.exists", return_value=True),
+            patch("sys.argv", ["flow-proxy-plugin"]),
+        ):
+            main()
+
+        assert signal.getsignal(signal.SIGTERM) is previous
+
+
+class TestDefaultNumWorkers:
+    """Unit tests for CPU count detection."""
+
+    def test_cgroup_quota(self, tmp_path: Path) -> None:
+        """cpu.max quota/period is converted to whole CPUs."""
+        from flow_proxy_plugin.cli import _cgroup_cpu_limit
+
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("250000 100000\n")
+        assert _cgroup_cpu_limit(cpu_max) == 2
+
+        cpu_max.write_text("50000 100000\n")
+        assert _cgroup_cpu_limit(cpu_max) == 1
+
+    def test_cgroup_unlimited_or_missing(self, tmp_path: Path) -> None:
+        """Unlimited or unreadable cpu.max yields no limit."""
+        from flow_proxy_plugin.cli import _cgroup_cpu_limit
+
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+        assert _cgroup_cpu_limit(cpu_max) is None
+        assert _cgroup_cpu_limit(tmp_path / "missing") is None
+
+    def test_quota_caps_default_and_is_cached(self) -> None:
+        """The cgroup quota caps the default, which is computed only once."""
+        from flow_proxy_plugin import cli
+
+        with (
+            patch.object(cli, "_DEFAULT_WORKERS", None),
+            patch.object(cli.os, "sched_getaffinity", return_value=set(range(8)), create=True),
+            patch.object(cli, "_cgroup_cpu_limit", return_value=2) as mock_limit,
+        ):
+            assert cli._default_num_workers() == 2
+            assert cli._default_num_workers() == 2
+            mock_limit.assert_called_once()
+
 
 class TestResolveRuntimeConfig:
     """Unit tests for _resolve_runtime_config() — clamping and warning behaviour."""
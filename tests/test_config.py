@@ -1,6 +1,7 @@
 """Tests for configuration management."""
 
 import json
+import logging
 import tempfile
 from typing import Any
 
@@ -122,3 +123,50 @@ class TestSecretsManager:
 
         with pytest.raises(ValueError, match="Secrets file must contain an array"):
             manager.load_secrets(temp_file)
+
+    def test_instances_share_logger(self) -> None:
+        """Test that instances carry no per-instance state."""
+        first, second = SecretsManager(), SecretsManager()
+        assert first.logger is second.logger
+        assert not hasattr(first, "__dict__")
+
+    def test_load_json5_secrets(self) -> None:
+        """Test secrets files using JSON5 syntax still load via the fallback parser."""
+        manager = SecretsManager()
+
+        content = """[
+            // primary account
+            {
+                "clientId": "client-id",
+                "clientSecret": "client-secret",
+                "tenant": "tenant",
+            },
+        ]"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write(content)
+            temp_file = f.name
+
+        secrets = manager.load_secrets(temp_file)
+
+        assert len(secrets) == 1
+        assert secrets[0]["clientId"] == "client-id"
+
+    def test_validate_secrets_logs_one_line_per_invalid_config(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test validate_secrets reports each invalid config once with all its errors."""
+        manager = SecretsManager()
+        secrets: list[dict[str, Any]] = [
+            {"clientId": "client", "clientSecret": "secret", "tenant": "tenant"},
+            {"clientId": "", "tenant": 1},
+        ]
+
+        with caplog.at_level(logging.ERROR, logger="flow_proxy_plugin.core.config"):
+            assert not manager.validate_secrets(secrets)
+
+        errors = [r.getMessage() for r in caplog.records]
+        assert len(errors) == 1
+        assert "index 1" in errors[0]
+        assert "Missing required fields: clientSecret" in errors[0]
+        assert "Field 'clientId' cannot be empty" in errors[0]
+        assert "Field 'tenant' must be a string, got int" in errors[0]
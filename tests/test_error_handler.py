@@ -3,9 +3,13 @@
 import json
 import logging
 from datetime import datetime
+from http import HTTPStatus
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
+from flow_proxy_plugin import error_handler as error_handler_module
 from flow_proxy_plugin.error_handler import ErrorCode, ErrorHandler
 
 
@@ -20,6 +24,7 @@ def test_error_handler_initialization(error_handler: ErrorHandler) -> None:
     """Test error handler initialization."""
     assert error_handler is not None
     assert error_handler.logger is not None
+    assert not hasattr(error_handler, "__dict__")
 
 
 def test_create_error_response_basic(error_handler: ErrorHandler) -> None:
@@ -238,3 +243,145 @@ def test_http_response_content_length_accurate(error_handler: ErrorHandler) -> N
             break
     else:
         pytest.fail("Content-Length header not found")
+
+
+def test_templated_response_matches_full_render(error_handler: ErrorHandler) -> None:
+    """Test the cached template path renders the same response as the full path."""
+    for error_code in ErrorCode:
+        fast = error_handler.format_error_response_http(error_code)
+        head, body = fast.split(b"\r\n\r\n", 1)
+
+        error_body = json.loads(body)
+        assert error_body["error"] == error_code.value
+        assert body == json.dumps(error_body, indent=2).encode("utf-8")
+
+        status_code = ErrorHandler.ERROR_STATUS_MAP[error_code]
+        assert head == (
+            f"HTTP/1.1 {status_code} {HTTPStatus(status_code).phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close"
+        ).encode()
+
+
+def test_precomputed_lookups_match_maps(error_handler: ErrorHandler) -> None:
+    """Test precomputed per-code lookups agree with the public error maps."""
+    for error_code in ErrorCode:
+        response = error_handler.create_error_response(error_code)
+        assert response["message"] == ErrorHandler.ERROR_MESSAGE_MAP[error_code]
+
+        http_response = error_handler.format_error_response_http(
+            error_code, details="x"
+        )
+        status_code = ErrorHandler.ERROR_STATUS_MAP[error_code]
+        assert http_response.startswith(f"HTTP/1.1 {status_code} ".encode())
+
+
+def test_log_error_levels_by_category(
+    error_handler: ErrorHandler, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test each error category logs at its level; request errors skip tracebacks."""
+    exception = ValueError("boom")
+    expected = {
+        ErrorCode.CONFIG_FILE_NOT_FOUND: logging.ERROR,
+        ErrorCode.AUTH_TOKEN_GENERATION_FAILED: logging.ERROR,
+        ErrorCode.INTERNAL_UNEXPECTED_ERROR: logging.ERROR,
+        ErrorCode.NETWORK_TIMEOUT: logging.WARNING,
+        ErrorCode.REQUEST_INVALID_FORMAT: logging.INFO,
+    }
+
+    with caplog.at_level(logging.INFO):
+        for error_code in expected:
+            error_handler.log_error(error_code, exception=exception)
+
+    assert [record.levelno for record in caplog.records] == list(expected.values())
+    for record in caplog.records:
+        assert (record.exc_info is None) == (record.levelno == logging.INFO)
+
+
+def test_log_error_skipped_when_level_disabled(
+    error_handler: ErrorHandler, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test nothing is formatted or emitted when the level is disabled."""
+    with caplog.at_level(logging.WARNING):
+        error_handler.log_error(
+            ErrorCode.REQUEST_MISSING_PATH, additional_context={"path": "/x"}
+        )
+
+    assert caplog.records == []
+
+
+def test_http_response_with_details_matches_json(error_handler: ErrorHandler) -> None:
+    """Test the detailed response body is indented JSON with a byte-accurate length."""
+    http_response = error_handler.format_error_response_http(
+        ErrorCode.NETWORK_TIMEOUT,
+        details="délai dépassé",
+        additional_context={"config_name": "naïve"},
+    )
+    head, body = http_response.split(b"\r\n\r\n", 1)
+
+    error_body = json.loads(body)
+    assert error_body["details"] == "délai dépassé"
+    assert error_body["context"] == {"config_name": "naïve"}
+    assert body == json.dumps(error_body, indent=2).encode("utf-8")
+    assert f"Content-Length: {len(body)}".encode() in head
+
+
+def test_timestamp_reused_within_refresh_window(
+    error_handler: ErrorHandler, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test error timestamps are formatted at most once per refresh window."""
+    monkeypatch.setattr(
+        error_handler_module, "_cached_timestamp", (float("-inf"), "", b"")
+    )
+    with patch.object(error_handler_module.time, "monotonic", return_value=1000.0):
+        first = error_handler.create_error_response(ErrorCode.NETWORK_TIMEOUT)
+        with patch.object(error_handler_module, "datetime") as mock_datetime:
+            second = error_handler.create_error_response(ErrorCode.NETWORK_TIMEOUT)
+            mock_datetime.now.assert_not_called()
+
+    assert second["timestamp"] == first["timestamp"]
+
+    refreshed = 1000.0 + error_handler_module._TIMESTAMP_REFRESH
+    with patch.object(error_handler_module.time, "monotonic", return_value=refreshed):
+        with patch.object(error_handler_module, "datetime") as mock_datetime:
+            mock_datetime.now.return_value.isoformat.return_value = "later"
+            third = error_handler.create_error_response(ErrorCode.NETWORK_TIMEOUT)
+
+    assert third["timestamp"] == "later"
+
+
+def test_log_error_context_rendered_only_when_emitted() -> None:
+    """Test the context is not stringified when no handler emits the record."""
+
+    class ExplodingContext(dict[str, Any]):
+        def items(self) -> Any:
+            raise AssertionError("context rendered")
+
+    logger = logging.getLogger("test_error_handler.lazy_context")
+    logger.propagate = False
+    handler = logging.NullHandler()
+    logger.addHandler(handler)
+    try:
+        ErrorHandler(logger).log_error(
+            ErrorCode.CONFIG_FILE_NOT_FOUND,
+            additional_context=ExplodingContext(path="/x"),
+        )
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_detailed_response_renders_context_types(
+    error_handler: ErrorHandler,
+) -> None:
+    """Test detailed responses keep context value types and a correct length."""
+    for context in ({"timeout": 30}, {"timeout": 30.0}, {"timeout": True}):
+        http_response = error_handler.format_error_response_http(
+            ErrorCode.NETWORK_TIMEOUT, details="timed out", additional_context=context
+        )
+        head, body = http_response.split(b"\r\n\r\n", 1)
+        error_body = json.loads(body)
+        assert error_body["context"] == context
+        assert type(error_body["context"]["timeout"]) is type(context["timeout"])
+        assert body == json.dumps(error_body, indent=2).encode("utf-8")
+        assert f"Content-Length: {len(body)}".encode() in head
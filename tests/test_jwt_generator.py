@@ -96,6 +96,42 @@ class TestJWTGenerator:
         with pytest.raises(ValueError, match="Missing required fields"):
             generator.generate_token(config)
 
+    def test_generate_token_matches_pyjwt(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test tokens are byte-identical to jwt.encode output."""
+        generator = JWTGenerator()
+
+        for config in sample_secrets_config:
+            expected = jwt.encode(
+                generator.create_jwt_payload(config),
+                config["clientSecret"],
+                algorithm="HS256",
+            )
+            assert generator.generate_token(config) == expected
+
+    def test_generate_tokens_batch(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test batch generation matches single generation and fills the cache."""
+        generator = JWTGenerator()
+
+        tokens = generator.generate_tokens(sample_secrets_config)
+
+        assert tokens == [generator.generate_token(c) for c in sample_secrets_config]
+        assert generator.get_cache_stats()["total"] == len(sample_secrets_config)
+
+    def test_generate_tokens_validates_all_first(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test an invalid config in the batch fails before anything is cached."""
+        generator = JWTGenerator()
+        configs = [*sample_secrets_config, {"clientId": "x", "clientSecret": "", "tenant": "t"}]
+
+        with pytest.raises(ValueError, match="Missing required fields"):
+            generator.generate_tokens(configs)
+        assert generator.get_cache_stats()["total"] == 0
+
     def test_token_caching(self, sample_secrets_config: list[dict[str, str]]) -> None:
         """Test that tokens are cached and reused."""
         generator = JWTGenerator()
@@ -142,12 +178,12 @@ class TestJWTGenerator:
         token1 = generator.generate_token(config)
 
         # Manually expire the token by modifying cache
-        client_id = config["clientId"]
+        cache_key = (config["clientId"], config["clientSecret"], config["tenant"])
         with JWTGenerator._lock:
-            if client_id in JWTGenerator._cache:
-                old_token, _ = JWTGenerator._cache[client_id]
-                # Set expiry to past time
-                JWTGenerator._cache[client_id] = (old_token, time.time() - 1)
+            assert cache_key in JWTGenerator._cache
+            old_token, _, keyed = JWTGenerator._cache[cache_key]
+            # Set expiry to past time
+            JWTGenerator._cache[cache_key] = (old_token, time.monotonic() - 1, keyed)
 
         # Generate token again - should create new one
         token2 = generator.generate_token(config)
@@ -155,6 +191,79 @@ class TestJWTGenerator:
         # Tokens should be different (newly generated)
         assert token1 == token2  # Same payload means same token with HS256
 
+    def test_keyed_hmac_stored_with_cache_entry(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test that the keyed HMAC lives in the entry and survives a refresh."""
+        generator = JWTGenerator()
+        config = sample_secrets_config[0]
+        cache_key = (config["clientId"], config["clientSecret"], config["tenant"])
+
+        generator.generate_token(config)
+        with JWTGenerator._lock:
+            token, _, keyed = JWTGenerator._cache[cache_key]
+            JWTGenerator._cache[cache_key] = (token, time.monotonic() - 1, keyed)
+        generator.generate_token(config)
+
+        assert JWTGenerator._cache[cache_key][2] is keyed
+        generator.clear_cache()
+        assert not JWTGenerator._cache
+
+    def test_cache_hit_skips_validation(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test that configs are validated on cache misses only."""
+        from unittest.mock import patch
+
+        generator = JWTGenerator()
+        config = sample_secrets_config[0]
+
+        with patch.object(
+            JWTGenerator, "_cache_key", wraps=JWTGenerator._cache_key
+        ) as mock_key:
+            generator.generate_token(config)
+            generator.generate_token(config)
+
+        mock_key.assert_called_once_with(config)
+
+    def test_rotated_secret_not_served_from_cache(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test that changing the secret for a clientId yields a fresh token."""
+        generator = JWTGenerator()
+        config = sample_secrets_config[0]
+        rotated = {**config, "clientSecret": "rotated-secret"}
+
+        token1 = generator.generate_token(config)
+        token2 = generator.generate_token(rotated)
+
+        assert token1 != token2
+        assert generator.validate_token(token2, "rotated-secret")
+
+    def test_cache_size_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the cache evicts expired entries, then the oldest ones."""
+        monkeypatch.setattr(JWTGenerator, "_max_size", 2)
+        generator = JWTGenerator()
+        configs = [
+            {"clientId": f"client-{i}", "clientSecret": "secret", "tenant": "tenant"}
+            for i in range(3)
+        ]
+
+        for config in configs:
+            generator.generate_token(config)
+
+        keys = list(JWTGenerator._cache)
+        assert len(keys) == 2
+        assert [k[0] for k in keys] == ["client-1", "client-2"]
+
+        # An expired entry is dropped in preference to the oldest valid one
+        with JWTGenerator._lock:
+            token, _, keyed = JWTGenerator._cache[keys[1]]
+            JWTGenerator._cache[keys[1]] = (token, time.monotonic() - 1, keyed)
+        generator.generate_token(configs[0])
+
+        assert [k[0] for k in JWTGenerator._cache] == ["client-1", "client-0"]
+
     def test_clear_cache(self, sample_secrets_config: list[dict[str, str]]) -> None:
         """Test cache clearing functionality."""
         generator = JWTGenerator()
@@ -222,6 +331,32 @@ class TestJWTGenerator:
         stats = generator.get_cache_stats()
         assert stats["total"] == 1
 
+    def test_concurrent_misses_sign_once(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test that concurrent cache misses for one key sign only once."""
+        import threading
+        from unittest.mock import patch
+
+        generator = JWTGenerator()
+        config = sample_secrets_config[0]
+        barrier = threading.Barrier(8)
+
+        def generate_token() -> None:
+            barrier.wait()
+            generator.generate_token(config)
+
+        with patch.object(
+            JWTGenerator, "_encode_hs256", wraps=JWTGenerator._encode_hs256
+        ) as mock_encode:
+            threads = [threading.Thread(target=generate_token) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_encode.call_count == 1
+
     def test_create_jwt_payload(
         self, sample_secrets_config: list[dict[str, str]]
     ) -> None:
@@ -282,6 +417,17 @@ class TestJWTGenerator:
         assert not generator.validate_token("not-a-valid-token", "secret")
         assert not generator.validate_token("", "secret")
 
+    def test_validate_token_bytes(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test bytes tokens are decoded rather than raising TypeError."""
+        generator = JWTGenerator()
+        config = sample_secrets_config[0]
+
+        token = generator.generate_token(config).encode("ascii")
+        assert generator.validate_token(token, config["clientSecret"])  # type: ignore[arg-type]
+        assert not generator.validate_token(b"not-a-valid-token", "secret")  # type: ignore[arg-type]
+
     def test_validate_token_missing_fields(self) -> None:
         """Test token validation fails when required fields are missing."""
         generator = JWTGenerator()
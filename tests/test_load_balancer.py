@@ -66,6 +66,17 @@ class TestLoadBalancer:
         next_config = lb.get_next_config()
         assert next_config["name"] == "config2"
 
+    def test_failover_keeps_rotation_position(self) -> None:
+        """Test failing a config does not send the next request back to the first."""
+        configs = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+        lb = LoadBalancer(configs)
+
+        assert lb.get_next_config() is configs[0]
+        lb.mark_config_failed(configs[1])
+
+        assert lb.get_next_config() is configs[2]
+        assert lb.get_next_config() is configs[0]
+
     def test_all_configs_failed(
         self, sample_secrets_config: list[dict[str, str]]
     ) -> None:
@@ -110,6 +121,35 @@ class TestLoadBalancer:
         config = lb.get_next_config()
         assert config is not None
 
+    def test_reset_restores_original_order(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test reset restores configs in their original round-robin order."""
+        lb = LoadBalancer(sample_secrets_config)
+
+        lb.mark_config_failed(sample_secrets_config[1])
+        lb.mark_config_failed(sample_secrets_config[0])
+        lb.reset_failed_configs()
+
+        assert lb.get_next_config() is sample_secrets_config[0]
+        assert lb.get_next_config() is sample_secrets_config[1]
+
+    def test_mark_unknown_config_failed(
+        self,
+        sample_secrets_config: list[dict[str, str]],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test marking a config not managed by the balancer is ignored."""
+        caplog.set_level(logging.WARNING)
+        lb = LoadBalancer(sample_secrets_config)
+
+        lb.mark_config_failed({"name": "stranger", "clientId": "x"})
+
+        assert lb.available_count == 2
+        assert lb.failed_count == 0
+        assert "Ignoring unknown config 'stranger'" in caplog.text
+        assert "already marked as failed" not in caplog.text
+
     def test_config_name_logging(
         self,
         sample_secrets_config: list[dict[str, str]],
@@ -148,3 +188,26 @@ class TestLoadBalancer:
         config = lb.get_next_config()
         assert config["clientId"] == "client-1"
         assert lb.total_requests == 1
+
+    def test_stats_and_repr(self, sample_secrets_config: list[dict[str, str]]) -> None:
+        """Test stats and repr report consistent counts."""
+        lb = LoadBalancer(sample_secrets_config)
+        lb.mark_config_failed(lb.get_next_config())
+
+        stats = lb.get_stats()
+        assert (stats.total_count, stats.available_count, stats.failed_count) == (2, 1, 1)
+        assert stats.total_requests == 1
+        assert repr(lb) == "LoadBalancer(total=2, available=1, failed=1, requests=1)"
+
+    def test_request_count_reads_do_not_change_it(
+        self, sample_secrets_config: list[dict[str, str]]
+    ) -> None:
+        """Test that reading the request count leaves it unchanged."""
+        lb = LoadBalancer(sample_secrets_config)
+        lb.get_next_config()
+
+        reads = [lb.total_requests, lb.get_stats().total_requests, lb.total_requests]
+        repr(lb)
+
+        assert reads == [1, 1, 1]
+        assert lb.total_requests == 1
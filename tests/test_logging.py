@@ -1,10 +1,13 @@
 """Tests for logging utilities."""
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from flow_proxy_plugin.utils.logging import (
     CleanupConfig,
     ColoredFormatter,
@@ -14,12 +17,18 @@ from flow_proxy_plugin.utils.logging import (
     LoggerFactory,
     LogSetup,
     RotationConfig,
+    env_log_level,
     setup_colored_logger,
     setup_file_handler_for_child_process,
     setup_logging,
 )
 
 
+def _log_from_worker() -> None:
+    """Worker target: log one record through the root queue handler."""
+    logging.getLogger("test.worker").info("from worker")
+
+
 class TestColors:
     """Tests for Colors class."""
 
@@ -208,6 +217,23 @@ class TestLogConfig:
         config = LogConfig(level="ERROR")
         assert config.log_level == logging.ERROR
 
+    def test_log_level_stdlib_aliases(self) -> None:
+        """Test that stdlib level aliases resolve like getattr(logging, name)."""
+        for name in ("WARN", "warn", "FATAL", "NOTSET"):
+            assert LogConfig(level=name).log_level == getattr(logging, name.upper())
+        assert LogConfig(level="bogus").log_level == logging.INFO
+
+    def test_env_log_level_read_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test FLOW_PROXY_LOG_LEVEL is read once and reused process-wide."""
+        from flow_proxy_plugin.utils import logging as logging_utils
+
+        monkeypatch.setattr(logging_utils, "_env_log_level", None)
+        monkeypatch.setenv("FLOW_PROXY_LOG_LEVEL", "DEBUG")
+        assert env_log_level() == "DEBUG"
+
+        monkeypatch.setenv("FLOW_PROXY_LOG_LEVEL", "ERROR")
+        assert env_log_level() == "DEBUG"
+
     def test_log_dir_path_property(self) -> None:
         """Test log_dir_path property returns Path object."""
         config = LogConfig(log_dir="test_logs")
@@ -338,6 +364,64 @@ class TestLogSetup:
         assert logging.root.level == logging.DEBUG
         assert len(logging.root.handlers) == 2  # console + file
 
+    def test_configure_root_logger_writes_file_in_background(self, tmp_path: Path) -> None:
+        """Test that file records are written via the queue listener."""
+        from flow_proxy_plugin.utils import logging as logging_utils
+
+        config = LogConfig(log_dir=str(tmp_path), level="INFO")
+        LogSetup(config).configure_root_logger()
+
+        assert any(
+            isinstance(h, logging.handlers.QueueHandler) for h in logging.root.handlers
+        )
+        logging.getLogger("test.queue").info("queued message")
+        logging_utils._stop_file_listener()
+
+        assert "queued message" in config.log_file_path.read_text(encoding="utf-8")
+
+    def test_file_listener_rebuilt_after_fork(self, tmp_path: Path) -> None:
+        """Test that the after-fork hook starts a new listener on a fresh queue."""
+        from flow_proxy_plugin.utils import logging as logging_utils
+
+        config = LogConfig(log_dir=str(tmp_path), level="INFO")
+        LogSetup(config).configure_root_logger()
+        old_listener = logging_utils._file_listener
+        assert old_listener is not None
+
+        # Stop the parent's thread first, as fork() would leave it behind
+        old_listener.stop()
+        logging_utils._restart_file_listener_after_fork()
+
+        new_listener = logging_utils._file_listener
+        assert new_listener is not None and new_listener is not old_listener
+        assert new_listener.queue is not old_listener.queue
+        assert new_listener.handlers == old_listener.handlers
+        logging.getLogger("test.fork").info("after fork")
+        logging_utils._stop_file_listener()
+
+        assert "after fork" in config.log_file_path.read_text(encoding="utf-8")
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires fork")
+    def test_worker_process_flushes_file_log_on_exit(self, tmp_path: Path) -> None:
+        """Test records queued in a multiprocessing worker reach the file on exit."""
+        import multiprocessing
+
+        from flow_proxy_plugin.utils import logging as logging_utils
+
+        config = LogConfig(log_dir=str(tmp_path), level="INFO")
+        LogSetup(config).configure_root_logger()
+        try:
+            worker = multiprocessing.get_context("fork").Process(
+                target=_log_from_worker
+            )
+            worker.start()
+            worker.join(10)
+            assert worker.exitcode == 0
+        finally:
+            logging_utils._stop_file_listener()
+
+        assert "from worker" in config.log_file_path.read_text(encoding="utf-8")
+
     @patch("flow_proxy_plugin.utils.log_cleaner.init_log_cleaner")
     def test_setup_complete(self, mock_init: Mock, tmp_path: Path) -> None:
         """Test complete setup process."""
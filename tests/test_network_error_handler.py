@@ -1,11 +1,19 @@
 """Tests for network error handler module."""
 
+import asyncio
 import logging
+import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
-from flow_proxy_plugin.network_error_handler import NetworkErrorHandler
+from flow_proxy_plugin.network_error_handler import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    NetworkErrorHandler,
+)
 
 
 @pytest.fixture
@@ -23,6 +31,7 @@ def test_network_handler_initialization(network_handler: NetworkErrorHandler) ->
     assert network_handler.default_timeout == 5.0
     assert network_handler.max_retries == 2
     assert network_handler.retry_delay == 0.1
+    assert not hasattr(network_handler, "__dict__")
 
 
 def test_handle_connection_error(network_handler: NetworkErrorHandler) -> None:
@@ -185,7 +194,8 @@ def test_execute_with_retry_custom_max_retries(
 def test_execute_with_retry_respects_delay(
     network_handler: NetworkErrorHandler,
 ) -> None:
-    """Test that retry logic respects delay between attempts."""
+    """Test that retry logic waits between attempts without jitter."""
+    network_handler.jitter = False
     call_times = []
 
     def operation() -> str:
@@ -202,6 +212,49 @@ def test_execute_with_retry_respects_delay(
     assert time_diff >= 0.1
 
 
+def test_execute_with_retry_exponential_backoff_capped(
+    network_handler: NetworkErrorHandler,
+) -> None:
+    """Test that retry delays double per attempt up to max_retry_delay."""
+    network_handler.jitter = False
+    network_handler.max_retry_delay = 0.3
+
+    def operation() -> str:
+        raise ConnectionError("Failure")
+
+    with patch("flow_proxy_plugin.network_error_handler.time.sleep") as mock_sleep:
+        with pytest.raises(ConnectionError):
+            network_handler.execute_with_retry(
+                operation, "test_operation", max_retries=4, retry_delay=0.1
+            )
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == pytest.approx(
+        [0.1, 0.2, 0.3, 0.3]
+    )
+
+
+def test_execute_with_retry_full_jitter(network_handler: NetworkErrorHandler) -> None:
+    """Test that jitter sleeps a random time between zero and the backoff."""
+
+    def operation() -> str:
+        raise ConnectionError("Failure")
+
+    with (
+        patch("flow_proxy_plugin.network_error_handler.time.sleep") as mock_sleep,
+        patch(
+            "flow_proxy_plugin.network_error_handler.random.uniform",
+            side_effect=lambda low, high: high / 2,
+        ) as mock_uniform,
+    ):
+        with pytest.raises(ConnectionError):
+            network_handler.execute_with_retry(
+                operation, "test_operation", retry_delay=0.1
+            )
+
+    assert [c.args for c in mock_uniform.call_args_list] == [(0, 0.1), (0, 0.2)]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1]
+
+
 def test_execute_with_timeout_success(network_handler: NetworkErrorHandler) -> None:
     """Test timeout execution with successful operation."""
 
@@ -221,10 +274,55 @@ def test_execute_with_timeout_raises_timeout(
     def operation() -> str:
         raise TimeoutError("Operation timed out")
 
-    with pytest.raises(TimeoutError):
+    # The operation's own error propagates unchanged, not as a pool timeout
+    with pytest.raises(TimeoutError, match="^Operation timed out$"):
         network_handler.execute_with_timeout(operation, "test_operation")
 
 
+def test_execute_with_timeout_enforces_timeout(
+    network_handler: NetworkErrorHandler,
+) -> None:
+    """Test a hung operation is abandoned once the timeout passes."""
+    release = threading.Event()
+
+    def operation() -> str:
+        release.wait(5)
+        return "late"
+
+    start = time.monotonic()
+    try:
+        with pytest.raises(TimeoutError):
+            network_handler.execute_with_timeout(
+                operation, "test_operation", timeout=0.05
+            )
+    finally:
+        release.set()
+
+    assert time.monotonic() - start < 1
+
+
+def test_execute_with_timeout_hung_operations_do_not_starve(
+    network_handler: NetworkErrorHandler,
+) -> None:
+    """Test hung operations hold only daemon threads and later calls still run."""
+    release = threading.Event()
+    try:
+        for _ in range(40):
+            with pytest.raises(TimeoutError):
+                network_handler.execute_with_timeout(
+                    lambda: release.wait(5), "hung_operation", timeout=0.01
+                )
+
+        thread = network_handler.execute_with_timeout(
+            threading.current_thread, "test_operation", timeout=1
+        )
+    finally:
+        release.set()
+
+    assert thread.daemon
+    assert thread.name == "flow-proxy-timeout"
+
+
 def test_check_upstream_availability(network_handler: NetworkErrorHandler) -> None:
     """Test upstream availability check."""
     target_url = "https://flow.ciandt.com/flow-llm-proxy"
@@ -292,15 +390,240 @@ def test_execute_with_retry_no_sleep_on_last_attempt(
         call_times.append(time.time())
         raise ConnectionError("Failure")
 
-    start_time = time.time()
+    with patch("flow_proxy_plugin.network_error_handler.time.sleep") as mock_sleep:
+        with pytest.raises(ConnectionError):
+            network_handler.execute_with_retry(
+                operation, "test_operation", max_retries=2, retry_delay=0.2
+            )
 
-    with pytest.raises(ConnectionError):
-        network_handler.execute_with_retry(
-            operation, "test_operation", max_retries=2, retry_delay=0.2
+    # 3 attempts with a sleep only between them, not after the last one
+    assert len(call_times) == 3
+    assert mock_sleep.call_count == 2
+
+
+def test_circuit_breaker_opens_after_failure_threshold() -> None:
+    """Test the breaker opens once enough failures land in one window."""
+    breaker = CircuitBreaker(failure_threshold=3, failure_ratio=0.5)
+
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_circuit_breaker_half_open_probe() -> None:
+    """Test the breaker probes after the cooldown and closes on success."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0, probe_limit=1)
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    assert breaker.allow_request()
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert not breaker.allow_request()  # probe slot taken
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_circuit_breaker_window_resets(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test failures from an expired window do not count toward opening."""
+    now = [100.0]
+    monkeypatch.setattr(
+        "flow_proxy_plugin.network_error_handler.time.monotonic", lambda: now[0]
+    )
+    breaker = CircuitBreaker(failure_threshold=2, window_seconds=5.0)
+
+    breaker.record_failure()
+    now[0] += 6.0
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_connection_errors_open_circuit(network_handler: NetworkErrorHandler) -> None:
+    """Test repeated connection errors make the upstream report unavailable."""
+    target_url = "https://flow.ciandt.com"
+    assert network_handler.check_upstream_availability(target_url)
+
+    for _ in range(5):
+        network_handler.handle_connection_error(ConnectionError("down"), target_url)
+
+    assert not network_handler.check_upstream_availability(target_url)
+    assert network_handler.check_upstream_availability("https://other.example")
+
+
+def test_availability_check_does_not_consume_probe(
+    network_handler: NetworkErrorHandler,
+) -> None:
+    """Test repeated availability checks leave the half-open probe slot free."""
+    target_url = "https://flow.ciandt.com"
+    breaker = network_handler.get_circuit_breaker(target_url)
+    breaker.failure_threshold = 1
+    breaker.reset_timeout = 0.0
+    network_handler.handle_connection_error(ConnectionError("down"), target_url)
+
+    results = [network_handler.check_upstream_availability(target_url) for _ in range(5)]
+
+    assert results == [True] * 5
+    assert breaker.allow_request()
+    assert breaker.state is CircuitState.HALF_OPEN
+    network_handler.record_success(target_url)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_reopens_on_second_outage(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test failures after the cooldown re-trip a breaker nobody probed."""
+    now = [100.0]
+    monkeypatch.setattr(
+        "flow_proxy_plugin.network_error_handler.time.monotonic", lambda: now[0]
+    )
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=10.0)
+    for _ in range(5):
+        breaker.record_failure()
+    assert not breaker.is_available()
+
+    now[0] += 10.0
+    assert breaker.is_available()
+    for _ in range(5):
+        breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.is_available()
+    now[0] += 10.0
+    assert breaker.is_available()
+
+
+def test_circuit_breaker_unreported_probe_expires(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a probe slot is released when no outcome is ever recorded."""
+    now = [100.0]
+    monkeypatch.setattr(
+        "flow_proxy_plugin.network_error_handler.time.monotonic", lambda: now[0]
+    )
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1.0, probe_timeout=5.0)
+    breaker.record_failure()
+    now[0] += 1.0
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    assert not breaker.is_available()
+
+    now[0] += 5.0
+    assert breaker.is_available()
+    assert breaker.allow_request()
+
+
+def test_circuit_breakers_are_capped(
+    network_handler: NetworkErrorHandler, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test idle breakers are evicted first and failure counts are kept."""
+    monkeypatch.setattr("flow_proxy_plugin.network_error_handler._MAX_BREAKERS", 3)
+    tripped = network_handler.get_circuit_breaker("https://a.example")
+    tripped.failure_threshold = 1
+    tripped.record_failure()
+    failing = network_handler.get_circuit_breaker("https://b.example")
+    failing.record_failure()
+    network_handler.get_circuit_breaker("https://c.example")
+
+    network_handler.get_circuit_breaker("https://d.example")
+
+    assert list(network_handler._breakers) == [
+        "https://a.example",
+        "https://b.example",
+        "https://d.example",
+    ]
+    assert network_handler.get_circuit_breaker("https://a.example") is tripped
+
+    network_handler.get_circuit_breaker("https://e.example")
+    assert "https://d.example" not in network_handler._breakers
+    assert network_handler.get_circuit_breaker("https://b.example") is failing
+
+
+def test_execute_with_retry_short_circuits_when_open(
+    network_handler: NetworkErrorHandler,
+) -> None:
+    """Test an open circuit stops execute_with_retry before calling upstream."""
+    target_url = "https://flow.ciandt.com"
+    breaker = network_handler.get_circuit_breaker(target_url)
+    breaker.failure_threshold = 1
+    call_count = 0
+
+    def operation() -> str:
+        nonlocal call_count
+        call_count += 1
+        raise ConnectionError("down")
+
+    with patch("flow_proxy_plugin.network_error_handler.time.sleep"):
+        with pytest.raises(CircuitOpenError):
+            network_handler.execute_with_retry(
+                operation, "test_operation", target_url=target_url
+            )
+
+    assert call_count == 1
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_execute_with_retry_async_retries_with_async_sleep(
+    network_handler: NetworkErrorHandler,
+) -> None:
+    """Test the async variant retries and backs off without blocking the loop."""
+    call_count = 0
+
+    async def operation() -> str:
+        nonlocal call_count
+        call_count += 1
+        if call_count < 3:
+            raise ConnectionError("Temporary failure")
+        return "success"
+
+    with (
+        patch("flow_proxy_plugin.network_error_handler.time.sleep") as mock_sleep,
+        patch(
+            "flow_proxy_plugin.network_error_handler.asyncio.sleep",
+            wraps=asyncio.sleep,
+        ) as mock_async_sleep,
+    ):
+        result = asyncio.run(
+            network_handler.execute_with_retry_async(
+                operation, "test_operation", retry_delay=0.01
+            )
         )
 
-    total_time = time.time() - start_time
+    assert result == "success"
+    assert call_count == 3
+    assert mock_async_sleep.call_count == 2
+    mock_sleep.assert_not_called()
+
+
+def test_execute_with_retry_async_times_out_each_attempt(
+    network_handler: NetworkErrorHandler,
+) -> None:
+    """Test each async attempt is bounded by the timeout."""
+
+    async def operation() -> str:
+        await asyncio.sleep(5)
+        return "late"
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            network_handler.execute_with_retry_async(
+                operation,
+                "test_operation",
+                max_retries=1,
+                retry_delay=0.01,
+                timeout=0.05,
+            )
+        )
 
-    # Should have 3 attempts with 2 delays (0.2s each)
-    # Total time should be around 0.4s, not 0.6s (which would include delay after last attempt)
-    assert total_time < 0.5  # Allow some margin for execution time
+    assert time.monotonic() - start < 1
@@ -1,5 +1,6 @@
 """Unit tests for FlowProxyPlugin main class."""
 
+from collections import namedtuple
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
@@ -7,6 +8,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from proxy.http.parser import HttpParser
 
+from flow_proxy_plugin.plugins.base_plugin import decode_bytes, extract_header_value
 from flow_proxy_plugin.plugins.proxy_plugin import FlowProxyPlugin
 
 
@@ -178,6 +180,20 @@ class TestFlowProxyPluginRequestProcessing:
             assert mock_gen.called
             assert mock_modify.called
 
+    def test_convert_reverse_proxy_request(self, plugin: FlowProxyPlugin) -> None:
+        """Path-only requests are rewritten to the target URL; full URLs are kept."""
+        request = Mock(spec=HttpParser)
+        request.path = b"/v1/models"
+        plugin._convert_reverse_proxy_request(request)
+        request.set_url.assert_called_once_with(
+            b"https://flow.ciandt.com/flow-llm-proxy/v1/models"
+        )
+
+        request = Mock(spec=HttpParser)
+        request.path = b"https://example.com/v1/models"
+        plugin._convert_reverse_proxy_request(request)
+        request.set_url.assert_not_called()
+
     def test_proxy_plugin_log_format(self, plugin: FlowProxyPlugin) -> None:
         """before_upstream_connection emits '→ POST /path [config]' format."""
         request = Mock(spec=HttpParser)
@@ -325,6 +341,15 @@ class TestFlowProxyPluginResponseProcessing:
 
         assert result == chunk
 
+    def test_handle_upstream_chunk_none_with_debug(
+        self, plugin: FlowProxyPlugin
+    ) -> None:
+        """Test a missing chunk is returned without sizing it under DEBUG."""
+        with patch.object(plugin.logger, "isEnabledFor", return_value=True):
+            result = plugin.handle_upstream_chunk(None)  # type: ignore[arg-type]
+
+        assert result is None
+
     def test_handle_upstream_chunk_error_handling(
         self, plugin: FlowProxyPlugin
     ) -> None:
@@ -332,15 +357,34 @@ class TestFlowProxyPluginResponseProcessing:
         chunk = memoryview(b"test data")
 
         # Mock request forwarder to raise exception
-        with patch.object(
-            plugin.request_forwarder,
-            "handle_response_chunk",
-            side_effect=Exception("Processing error"),
+        with (
+            patch.object(
+                plugin.request_forwarder, "passthrough_response_chunks", False
+            ),
+            patch.object(
+                plugin.request_forwarder,
+                "handle_response_chunk",
+                side_effect=Exception("Processing error"),
+            ),
         ):
             # Should still return chunk to maintain connection stability
             result = plugin.handle_upstream_chunk(chunk)
             assert result == chunk
 
+    def test_handle_upstream_chunk_passthrough_skips_forwarder(
+        self, plugin: FlowProxyPlugin
+    ) -> None:
+        """Test pass-through chunks are returned as-is without a forwarder call."""
+        chunk = memoryview(b"data: {}\n\n")
+
+        with patch.object(
+            plugin.request_forwarder, "handle_response_chunk"
+        ) as mock_handle:
+            result = plugin.handle_upstream_chunk(chunk)
+
+        assert result is chunk
+        mock_handle.assert_not_called()
+
     def test_on_upstream_connection_close(self, plugin: FlowProxyPlugin) -> None:
         """Test upstream connection close handler."""
         # Should not raise any exceptions
@@ -359,3 +403,32 @@ class TestFlowProxyPluginResponseProcessing:
         assert "available_configs" in result["load_balancer_stats"]
         assert "failed_configs" in result["load_balancer_stats"]
         assert "total_requests" in result["load_balancer_stats"]
+
+
+class TestBasePluginHelpers:
+    """Test cases for the shared decoding helpers."""
+
+    def test_extract_header_value_shapes(self) -> None:
+        """Header values decode from tuples, bytes, str and other types."""
+        assert extract_header_value((b"value", b"ignored")) == "value"
+        assert extract_header_value(b"value") == "value"
+        assert extract_header_value("value") == "value"
+        assert extract_header_value(42) == "42"
+        assert FlowProxyPlugin._extract_header_value(b"value") == "value"
+
+    def test_extract_header_value_subclasses(self) -> None:
+        """Tuple and bytes subclasses are unwrapped like their base types."""
+        Header = namedtuple("Header", ["value", "raw"])
+
+        class RawBytes(bytes):
+            pass
+
+        assert extract_header_value(Header(b"value", b"ignored")) == "value"
+        assert extract_header_value(RawBytes(b"value")) == "value"
+        assert decode_bytes(RawBytes(b"value")) == "value"
+
+    def test_decode_bytes(self) -> None:
+        """Bytes are decoded and strings pass through unchanged."""
+        assert decode_bytes(b"/v1/models") == "/v1/models"
+        assert decode_bytes("/v1/models") == "/v1/models"
+        assert FlowProxyPlugin._decode_bytes(b"GET") == "GET"
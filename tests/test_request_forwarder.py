@@ -33,6 +33,17 @@ def test_request_forwarder_initialization(request_forwarder: RequestForwarder) -
     assert request_forwarder.target_host == "flow.ciandt.com"
 
 
+def test_target_base_url_bytes_follow_assignment(
+    request_forwarder: RequestForwarder,
+) -> None:
+    """Test that the encoded base URL is kept in sync with target_base_url."""
+    assert request_forwarder.target_base_url_bytes == (
+        b"https://flow.ciandt.com/flow-llm-proxy"
+    )
+    request_forwarder.target_base_url = "https://example.com"
+    assert request_forwarder.target_base_url_bytes == b"https://example.com"
+
+
 def test_modify_request_headers_adds_authorization(
     request_forwarder: RequestForwarder, mock_request: Any
 ) -> None: